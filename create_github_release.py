@@ -6,11 +6,12 @@ This script helps package the application and prepare it for GitHub Releases.
 
 import os
 import sys
-import zipfile
 import shutil
 import subprocess
 from datetime import datetime
 
+from release_utils import scan, arcname_for, build_source_zip
+
 def create_release_package():
     """Create a release package for GitHub Releases"""
     print("Creating release package for GitHub...")
@@ -26,16 +27,8 @@ def create_release_package():
     
     # Copy source code
     source_code_zip = os.path.join(release_dir, f"PhotoWatermark_{version}_source.zip")
-    with zipfile.ZipFile(source_code_zip, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk('.'):
-            # Skip git, temp, and release directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['temp_release', 'release', '__pycache__', 'test_output', 'test_formats']]
-            
-            for file in files:
-                if not file.endswith(('.pyc', '.pyo', '.log')) and not file.startswith('.'):
-                    file_path = os.path.join(root, file)
-                    arc_path = os.path.relpath(file_path, '.')
-                    zipf.write(file_path, arc_path)
+    entries = [(path, arcname_for(path), st) for path, st in scan('.')]
+    build_source_zip(source_code_zip, entries)
     
     print(f"Created source code package: {source_code_zip}")
     
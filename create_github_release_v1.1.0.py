@@ -4,27 +4,33 @@ Script to create a complete GitHub release package for the Photo Watermark Appli
 This includes the fixed executable and all necessary documentation.
 """
 
+import argparse
 import os
 import sys
-import zipfile
-import shutil
 import subprocess
+import zipfile
 from datetime import datetime
 
-def create_github_release_package():
-    """Create a complete GitHub release package with the fixed executable"""
+from release_utils import collect, arcname_for, compress_type_for, open_zip, cached_source_zip
+
+def create_github_release_package(quiet=False):
+    """Create a complete GitHub release package with the fixed executable.
+
+    With quiet=True the per-file progress lines are not printed.
+    """
     print("Creating GitHub release package for Photo Watermark Application v1.1.0...")
     print("=" * 60)
     
-    # Create release directory
-    release_dir = "github_release_v1.1.0"
-    if os.path.exists(release_dir):
-        shutil.rmtree(release_dir)
-    os.makedirs(release_dir)
+    # Everything is written straight into the final release archive
+    timestamp = datetime.now().strftime("%Y%m%d")
+    release_zip = f"PhotoWatermark_v1.1.0_GitHub_Release_{timestamp}.zip"
+    generated_files = {}
     
     # Check if the fixed executable exists
     exe_path = os.path.join("dist", "PhotoWatermark_v1.1.0_20251001.exe")
-    if not os.path.exists(exe_path):
+    try:
+        exe_stat = os.stat(exe_path)
+    except FileNotFoundError:
         print("❌ Error: Fixed executable not found!")
         print(f"   Expected path: {exe_path}")
         print("   Please run build_robust.bat first to create the executable.")
@@ -32,12 +38,9 @@ def create_github_release_package():
     
     print("✓ Found fixed executable")
     
-    # Copy the fixed executable to release directory
     release_exe_name = "PhotoWatermark_v1.1.0_Windows_x64.exe"
-    shutil.copy2(exe_path, os.path.join(release_dir, release_exe_name))
-    print(f"✓ Copied executable as: {release_exe_name}")
     
-    # Copy documentation files
+    # Documentation files to include
     docs_to_copy = [
         "README.md",
         "RELEASE_NOTES.md", 
@@ -47,17 +50,10 @@ def create_github_release_package():
         "GITHUB_RELEASE_INSTRUCTIONS.md"
     ]
     
-    for doc in docs_to_copy:
-        if os.path.exists(doc):
-            shutil.copy2(doc, os.path.join(release_dir, doc))
-            print(f"✓ Copied {doc}")
-        else:
-            print(f"⚠ Warning: {doc} not found")
+    docs = [doc for doc, _ in collect(docs_to_copy)]
     
     # Create installation instructions
-    install_instructions = os.path.join(release_dir, "INSTALLATION.md")
-    with open(install_instructions, 'w', encoding='utf-8') as f:
-        f.write("""# Photo Watermark Application v1.1.0 - Installation Instructions
+    generated_files["INSTALLATION.md"] = """# Photo Watermark Application v1.1.0 - Installation Instructions
 
 ## Windows Installation
 
@@ -104,7 +100,7 @@ If the application fails to start:
 
 For any issues, please report them at:
 https://github.com/lzzz0001/photo-homework/issues
-""")
+"""
     
     print("✓ Created installation instructions")
     
@@ -122,29 +118,12 @@ https://github.com/lzzz0001/photo-homework/issues
         "src/"
     ]
     
-    source_zip = os.path.join(release_dir, "PhotoWatermark_v1.1.0_source.zip")
-    with zipfile.ZipFile(source_zip, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for item in source_files:
-            if os.path.exists(item):
-                if os.path.isfile(item):
-                    zf.write(item)
-                    print(f"✓ Added to source package: {item}")
-                elif os.path.isdir(item):
-                    for root, dirs, files in os.walk(item):
-                        # Skip __pycache__ directories
-                        dirs[:] = [d for d in dirs if not d.startswith('__') and d != '.git']
-                        for file in files:
-                            if not file.endswith(('.pyc', '.pyo')):
-                                file_path = os.path.join(root, file)
-                                zf.write(file_path)
-                                print(f"✓ Added to source package: {file_path}")
-    
-    print("✓ Created source code package")
+    entries = [(path, arcname_for(path), st) for path, st in collect(source_files)]
+    source_zip = cached_source_zip(entries)
+    print(f"✓ Created source code package ({len(entries)} files)")
     
     # Create release notes specific to this release
-    release_notes = os.path.join(release_dir, "RELEASE_NOTES_v1.1.0.md")
-    with open(release_notes, 'w', encoding='utf-8') as f:
-        f.write("""# Photo Watermark Application v1.1.0 Release Notes
+    generated_files["RELEASE_NOTES_v1.1.0.md"] = """# Photo Watermark Application v1.1.0 Release Notes
 
 ## Version Information
 - Version: v1.1.0
@@ -196,14 +175,12 @@ For a complete changelog, see `CHANGELOG.md`.
 
 For issues, questions, or feature requests, please visit:
 https://github.com/lzzz0001/photo-homework/issues
-""")
+"""
     
     print("✓ Created release notes")
     
     # Create a summary file
-    summary_file = os.path.join(release_dir, "RELEASE_SUMMARY.txt")
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write("""Photo Watermark Application v1.1.0 - GitHub Release Package
+    generated_files["RELEASE_SUMMARY.txt"] = """Photo Watermark Application v1.1.0 - GitHub Release Package
 ================================================================
 
 This package contains everything needed for the v1.1.0 release of the Photo Watermark Application.
@@ -219,22 +196,37 @@ The executable now properly includes all dependencies and should start without i
 
 For installation instructions, see INSTALLATION.md
 For detailed release notes, see RELEASE_NOTES_v1.1.0.md
-""")
+"""
     
     print("✓ Created release summary")
     
-    # Calculate file sizes
-    exe_size = os.path.getsize(os.path.join(release_dir, release_exe_name)) / (1024 * 1024)  # MB
-    source_size = os.path.getsize(source_zip) / (1024 * 1024)  # MB
+    # Write the release archive; sources are read once and never staged on disk
+    with open_zip(release_zip) as zf:
+        zf.write(exe_path, release_exe_name, compress_type=compress_type_for(release_exe_name))
+        if not quiet:
+            print(f"✓ Added executable as: {release_exe_name}")
+        for doc in docs:
+            zf.write(doc, os.path.basename(doc))
+            if not quiet:
+                print(f"✓ Added {doc}")
+        zf.write(source_zip, "PhotoWatermark_v1.1.0_source.zip", compress_type=zipfile.ZIP_STORED)
+        for name, content in generated_files.items():
+            zf.writestr(name, content)
+        sizes = {info.filename: info.file_size for info in zf.infolist()}
+    
+    # Calculate file sizes from the archive's own entries; no extra stat() calls
+    exe_size = exe_stat.st_size / (1024 * 1024)  # MB
+    source_size = sizes["PhotoWatermark_v1.1.0_source.zip"] / (1024 * 1024)  # MB
+    total_files = len(sizes)
     
     print(f"\n📦 Release Package Summary:")
     print(f"   Executable: {exe_size:.1f} MB")
     print(f"   Source code: {source_size:.1f} MB")
-    print(f"   Total files: {len(os.listdir(release_dir))} items")
-    print(f"   Release directory: {release_dir}")
+    print(f"   Total files: {total_files} items")
+    print(f"   Release archive: {release_zip}")
     
     print(f"\n🚀 GitHub Release Package Ready!")
-    print(f"   Contents are in the '{release_dir}' directory.")
+    print(f"   Contents are in '{release_zip}'.")
     print(f"   You can now upload these files to GitHub Releases.")
     
     print(f"\n📋 Next Steps for GitHub Release:")
@@ -242,7 +234,7 @@ For detailed release notes, see RELEASE_NOTES_v1.1.0.md
     print(f"   2. Click 'Draft a new release'")
     print(f"   3. Create tag: v1.1.0")
     print(f"   4. Title: 'Photo Watermark Application v1.1.0'")
-    print(f"   5. Upload all files from the '{release_dir}' directory")
+    print(f"   5. Upload all files from '{release_zip}'")
     print(f"   6. Copy release notes from RELEASE_NOTES_v1.1.0.md")
     print(f"   7. Publish release")
     
@@ -253,7 +245,11 @@ def main():
     print("Photo Watermark Application - GitHub Release Package Creator v1.1.0")
     print("=" * 70)
     
-    success = create_github_release_package()
+    parser = argparse.ArgumentParser(description="Create the v1.1.0 GitHub release package")
+    parser.add_argument("--quiet", action="store_true", help="do not print per-file progress")
+    args = parser.parse_args()
+    
+    success = create_github_release_package(quiet=args.quiet)
     if not success:
         sys.exit(1)
     
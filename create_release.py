@@ -2,98 +2,132 @@
 Script to help create a GitHub release with the built executable
 """
 
+import argparse
 import os
 import shutil
-import zipfile
 from datetime import datetime
 
-def create_release_package():
-    """Create a release package with the executable and documentation"""
+from release_utils import (scan, collect, arcname_for, fast_copy, build_source_zip,
+                           input_digest, write_source_zip)
+
+EXE_PATH = os.path.join("dist", "PhotoWatermark_v1.1.0_20251001.exe")
+
+DOCS_TO_COPY = [
+    "README.md",
+    "RELEASE_NOTES.md",
+    "LICENSE",
+    "CHANGELOG.md"
+]
+
+SOURCE_FILES = [
+    "main.py",
+    "requirements.txt",
+    "create_release.py",
+    "create_github_release.py",
+    "release_utils.py",
+    "PhotoWatermark.spec",
+    "test_app.py",
+    "test_dragdrop.py",
+    "test_missing_features.py",
+    "src/"
+]
+
+def create_release_package(include_exe=False, output_zip=None):
+    """Create a release package with the documentation, sources and optionally the executable.
+    
+    A sidecar '<output_zip>.hash' records the names, mtimes and sizes of all
+    inputs; when they are unchanged since the last run the existing package
+    is kept and nothing is rebuilt.
+    """
     
     print("Creating release package...")
     
+    if output_zip is None:
+        timestamp = datetime.now().strftime("%Y%m%d")
+        variant = "windows" if include_exe else "source_only"
+        output_zip = f"PhotoWatermark_v1.1.0_{timestamp}_{variant}.zip"
+    
+    docs = list(collect(DOCS_TO_COPY))
+    source_entries = [(path, arcname_for(path), st) for path, st in collect(SOURCE_FILES)]
+    inputs = docs + [(path, st) for path, _, st in source_entries]
+    
+    if include_exe:
+        try:
+            inputs.append((EXE_PATH, os.stat(EXE_PATH)))
+        except FileNotFoundError:
+            print(f"❌ Error: Executable not found at {EXE_PATH}")
+            print("   Run 'pyinstaller --onefile --windowed main.py' first.")
+            return False
+    else:
+        # Executables should be uploaded as GitHub Releases instead
+        print("ℹ️  Executables are no longer stored in the repository.")
+        print("   They should be uploaded as GitHub Releases instead.")
+    
+    # Skip the whole build when no input changed since the last package
+    digest = input_digest(inputs, f"include_exe={include_exe}")
+    hash_file = output_zip + ".hash"
+    if os.path.exists(output_zip) and os.path.exists(hash_file):
+        with open(hash_file, 'r', encoding='utf-8') as f:
+            if f.read().strip() == digest:
+                print(f"✓ No changes since {output_zip} was built, skipping")
+                return True
+    
     # Create release directory
     release_dir = "release"
     if os.path.exists(release_dir):
         shutil.rmtree(release_dir)
     os.makedirs(release_dir)
     
-    # Note: We no longer copy the executable to the repository
-    # Executables should be uploaded as GitHub Releases instead
-    print("ℹ️  Executables are no longer stored in the repository.")
-    print("   They should be uploaded as GitHub Releases instead.")
+    if include_exe:
+        exe_path, exe_stat = inputs[-1]
+        fast_copy(exe_path, os.path.join(release_dir, os.path.basename(exe_path)), exe_stat)
+        print(f"✓ Copied {exe_path}")
     
     # Copy documentation
-    docs_to_copy = [
-        "README.md",
-        "RELEASE_NOTES.md", 
-        "LICENSE",
-        "CHANGELOG.md"
-    ]
-    
-    for doc in docs_to_copy:
-        if os.path.exists(doc):
-            shutil.copy2(doc, os.path.join(release_dir, doc))
-            print(f"✓ Copied {doc}")
+    for doc, doc_stat in docs:
+        fast_copy(doc, os.path.join(release_dir, doc), doc_stat)
+        print(f"✓ Copied {doc}")
     
     # Create source code zip
     print("Creating source code archive...")
-    source_files = [
-        "main.py",
-        "requirements.txt",
-        "create_release.py",
-        "create_github_release.py",
-        "PhotoWatermark.spec",
-        "test_app.py",
-        "test_dragdrop.py",
-        "test_missing_features.py",
-        "src/"
-    ]
-    
-    with zipfile.ZipFile(os.path.join(release_dir, "source_code.zip"), 'w', zipfile.ZIP_DEFLATED) as zf:
-        for item in source_files:
-            if os.path.isfile(item):
-                zf.write(item)
-            elif os.path.isdir(item):
-                for root, dirs, files in os.walk(item):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        zf.write(file_path)
+    build_source_zip(os.path.join(release_dir, "source_code.zip"), source_entries)
     
     print("✓ Created source code archive")
     
-    # Create a simple release package with just documentation
-    timestamp = datetime.now().strftime("%Y%m%d")
-    release_zip = f"PhotoWatermark_v1.1.0_{timestamp}_source_only.zip"
+    # Create the release package from the release directory
+    entries = [(path, arcname_for(path, release_dir), st) for path, st in scan(release_dir)]
+    write_source_zip(output_zip, entries)
+    with open(hash_file, 'w', encoding='utf-8') as f:
+        f.write(digest)
     
-    with zipfile.ZipFile(release_zip, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for root, dirs, files in os.walk(release_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, release_dir)
-                zf.write(file_path, arcname)
-    
-    print(f"✓ Created source-only release package: {release_zip}")
+    print(f"✓ Created release package: {output_zip}")
     
     # Calculate file sizes
-    zip_size = os.path.getsize(release_zip) / (1024 * 1024)  # MB
+    zip_size = os.stat(output_zip).st_size / (1024 * 1024)  # MB
     
     print(f"\n📦 Release Summary:")
     print(f"   Release package: {zip_size:.1f} MB")
-    print(f"   Files included: {len(os.listdir(release_dir))} items")
+    print(f"   Files included: {len(entries)} items")
     
     print(f"\n🚀 Ready for GitHub release!")
-    print(f"   Upload: {release_zip}")
+    print(f"   Upload: {output_zip}")
     print(f"   Tag: v1.1.0")
     print(f"   Title: Photo Watermark Application v1.1.0")
-    print("\n💡 To create executables for release:")
-    print("   1. Run 'pyinstaller --onefile --windowed main.py'")
-    print("   2. Upload the executable as a GitHub Release asset")
-    print("   3. Source code is already in this package")
+    if not include_exe:
+        print("\n💡 To create executables for release:")
+        print("   1. Run 'pyinstaller --onefile --windowed main.py'")
+        print("   2. Upload the executable as a GitHub Release asset")
+        print("   3. Source code is already in this package")
     
     return True
 
 if __name__ == "__main__":
-    success = create_release_package()
+    parser = argparse.ArgumentParser(description="Create a release package")
+    parser.add_argument("--include-exe", action="store_true",
+                        help=f"also package the executable from {EXE_PATH}")
+    parser.add_argument("--output", help="path of the release zip to create")
+    args = parser.parse_args()
+    
+    success = create_release_package(include_exe=args.include_exe, output_zip=args.output)
     if not success:
-        exit(1)
\ No newline at end of file
+        exit(1)
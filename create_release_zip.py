@@ -1,9 +1,14 @@
-import zipfile
 import os
 from datetime import datetime
 
+from release_utils import open_zip, compress_type_for
+
 def create_release_zip():
-    """Create a zip file of the release directory"""
+    """Create a zip file of an already staged release directory.
+
+    create_github_release_v1.1.0.py now writes its release archive directly;
+    this is only needed for directories assembled by hand.
+    """
     # Get current timestamp
     timestamp = datetime.now().strftime("%Y%m%d")
     zip_filename = f"PhotoWatermark_v1.1.0_GitHub_Release_{timestamp}.zip"
@@ -13,10 +18,10 @@ def create_release_zip():
     release_files = os.listdir(release_dir)
     
     # Create zip file
-    with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zf:
+    with open_zip(zip_filename) as zf:
         for filename in release_files:
             file_path = os.path.join(release_dir, filename)
-            zf.write(file_path, filename)
+            zf.write(file_path, filename, compress_type=compress_type_for(filename))
     
     print(f"Created release package: {zip_filename}")
     file_size = os.path.getsize(zip_filename) / (1024 * 1024)  # MB
@@ -6,7 +6,17 @@ Debug script to test the executable and capture any errors
 import subprocess
 import sys
 import os
-import time
+
+def wait_for_input_idle(process, timeout_ms):
+    """Block until a Windows GUI process is waiting for input; True if it got there"""
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            result = ctypes.windll.user32.WaitForInputIdle(int(process._handle), timeout_ms)
+            return result == 0 and process.poll() is None
+        except Exception:
+            return False
+    return False
 
 def debug_executable():
     """Debug the executable by capturing its output"""
@@ -35,37 +45,29 @@ def debug_executable():
             errors='ignore'
         )
         
-        # Wait for a few seconds to see if it crashes
-        time.sleep(5)
+        # On Windows, return as soon as the GUI message loop is idle
+        gui_ready = sys.platform == 'win32' and wait_for_input_idle(process, 5000)
         
-        # Check if process is still running
-        if process.poll() is None:
+        # Wait up to 5 seconds for an early exit; a crash returns immediately
+        try:
+            stdout, stderr = process.communicate(timeout=0 if gui_ready else 5)
+        except subprocess.TimeoutExpired:
             print("✓ Executable started successfully and is running")
-            # Give it a bit more time
-            time.sleep(2)
             # Terminate the process
             process.terminate()
             try:
                 stdout, stderr = process.communicate(timeout=5)
-                if stdout:
-                    print(f"STDOUT:\n{stdout}")
-                if stderr:
-                    print(f"STDERR:\n{stderr}")
             except subprocess.TimeoutExpired:
                 process.kill()
                 stdout, stderr = process.communicate()
-                if stdout:
-                    print(f"STDOUT:\n{stdout}")
-                if stderr:
-                    print(f"STDERR:\n{stderr}")
         else:
             # Process has terminated, check exit code
-            stdout, stderr = process.communicate()
             print(f"Process terminated with exit code: {process.returncode}")
-            if stdout:
-                print(f"STDOUT:\n{stdout}")
-            if stderr:
-                print(f"STDERR:\n{stderr}")
+        
+        if stdout:
+            print(f"STDOUT:\n{stdout}")
+        if stderr:
+            print(f"STDERR:\n{stderr}")
                 
     except Exception as e:
         print(f"✗ Failed to start executable: {e}")
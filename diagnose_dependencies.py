@@ -42,6 +42,9 @@ def check_pil_installation():
     ]
     
     for module_name in modules_to_test:
+        if module_name in sys.modules:
+            print(f"✓ {module_name} already loaded")
+            continue
         try:
             __import__(module_name)
             print(f"✓ {module_name} import successful")
@@ -72,6 +75,9 @@ def check_tkinter_installation():
         # Test tkinter submodules
         submodules = ['tkinter.ttk', 'tkinter.messagebox', 'tkinter.filedialog']
         for submodule in submodules:
+            if submodule in sys.modules:
+                print(f"✓ {submodule} already loaded")
+                continue
             try:
                 __import__(submodule)
                 print(f"✓ {submodule} import successful")
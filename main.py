@@ -15,27 +15,44 @@ Version: 1.1.0
 
 import sys
 import os
-import tkinter as tk
-from tkinter import messagebox
 
 # Add the src directory to the Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 src_dir = os.path.join(current_dir, 'src')
 sys.path.insert(0, src_dir)
 
+def show_error_dialog(title, message):
+    """Show an error in a message box, falling back to the console.
+
+    tkinter is imported here rather than at module level so a normal start
+    does not pay for it before the dependency check has run.
+    """
+    try:
+        import tkinter as tk
+        from tkinter import messagebox
+        root = tk.Tk()
+        root.withdraw()  # Hide the main window
+        messagebox.showerror(title, message)
+        root.destroy()
+    except:
+        print(f"ERROR: {message}")
+
 def check_dependencies():
     """Check if all required dependencies are available"""
     missing_deps = []
     
-    try:
-        from PIL import Image
-    except ImportError:
-        missing_deps.append("Pillow")
+    # Modules already loaded (e.g. bundled by PyInstaller) need no import attempt
+    if 'PIL.Image' not in sys.modules:
+        try:
+            import PIL.Image
+        except ImportError:
+            missing_deps.append("Pillow")
     
-    try:
-        import tkinter
-    except ImportError:
-        missing_deps.append("tkinter")
+    if 'tkinter' not in sys.modules:
+        try:
+            import tkinter
+        except ImportError:
+            missing_deps.append("tkinter")
     
     if missing_deps:
         error_msg = f"Missing required dependencies: {', '.join(missing_deps)}\n\n"
@@ -43,13 +60,7 @@ def check_dependencies():
         error_msg += "pip install -r requirements.txt"
         
         # Try to show error in GUI if tkinter is available
-        try:
-            root = tk.Tk()
-            root.withdraw()  # Hide the main window
-            messagebox.showerror("Missing Dependencies", error_msg)
-            root.destroy()
-        except:
-            print(f"ERROR: {error_msg}")
+        show_error_dialog("Missing Dependencies", error_msg)
         
         return False
     
@@ -67,13 +78,7 @@ def setup_application_environment():
         return True
     except Exception as e:
         error_msg = f"Failed to setup application environment: {e}"
-        try:
-            root = tk.Tk()
-            root.withdraw()
-            messagebox.showerror("Setup Error", error_msg)
-            root.destroy()
-        except:
-            print(f"ERROR: {error_msg}")
+        show_error_dialog("Setup Error", error_msg)
         return False
 
 def main():
@@ -107,28 +112,19 @@ def main():
         error_msg = f"Failed to import application modules: {e}\n\n"
         error_msg += "Please ensure all source files are present in the 'src' directory."
         
-        try:
-            root = tk.Tk()
-            root.withdraw()
-            messagebox.showerror("Import Error", error_msg)
-            root.destroy()
-        except:
-            print(f"ERROR: {error_msg}")
+        show_error_dialog("Import Error", error_msg)
         
         sys.exit(1)
         
     except Exception as e:
         error_msg = f"Unexpected error occurred: {e}"
         
-        try:
-            root = tk.Tk()
-            root.withdraw()
-            messagebox.showerror("Application Error", error_msg)
-            root.destroy()
-        except:
-            print(f"ERROR: {error_msg}")
+        show_error_dialog("Application Error", error_msg)
         
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Batch export uses worker processes; frozen Windows builds need this to start them
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
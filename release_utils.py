@@ -0,0 +1,549 @@
+"""
+Shared helpers for the release packaging scripts.
+Scans the source tree with os.scandir and builds ZIP archives whose entries
+are deflated in parallel worker processes before being written sequentially.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import struct
+import sys
+import time
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+# Filters shared by every source archive walk
+SKIP_DIRS = frozenset({'temp_release', 'release', '__pycache__', 'test_output', 'test_formats'})
+SKIP_EXTENSIONS = frozenset({'.pyc', '.pyo', '.log'})
+
+# Already-compressed payloads are stored as-is; deflating them again only
+# burns CPU and usually makes them slightly larger
+STORED_EXTENSIONS = frozenset({'.zip', '.gz', '.xz', '.7z', '.exe', '.png', '.jpg'})
+
+# Deflate level for release archives. Level 1 is much faster than the default
+# level 6 and barely larger for Python and Markdown sources; set
+# PHOTOWATERMARK_ZIP_LEVEL=9 for the final published artifact if desired.
+def _zip_level_from_env(default='1'):
+    """Read the deflate level from PHOTOWATERMARK_ZIP_LEVEL, exiting with a clear message if invalid"""
+    value = os.environ.get('PHOTOWATERMARK_ZIP_LEVEL') or default
+    try:
+        level = int(value)
+    except ValueError:
+        level = None
+    if level is None or not 0 <= level <= 9:
+        # Caught here rather than as a zlib error inside a compression worker
+        sys.exit(f"❌ Error: PHOTOWATERMARK_ZIP_LEVEL must be a whole number from 0 to 9, got {value!r}")
+    return level
+
+ZIP_LEVEL = _zip_level_from_env()
+
+# Files handed to each compression worker at once; keeps per-task IPC overhead
+# well below the time spent deflating
+COMPRESS_CHUNKSIZE = 32
+
+# Files above this size are streamed into the archive instead of being read
+# into memory and compressed by a worker
+STREAM_THRESHOLD = 8 * 1024 * 1024
+READ_BUFFER_SIZE = 1 << 20
+
+# Archives are written through one large buffer to cut down on write() calls
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Content-addressed store of previously built source archives
+CACHE_DIR = '.zip_cache'
+
+# Newest archives kept in CACHE_DIR after a build; older ones are deleted
+CACHE_KEEP = 3
+
+# Per-file record of which cached archive already holds a compressed copy
+RELEASE_CACHE_FILE = '.release_cache.json'
+
+
+def scan(root='.', skip_dirs=SKIP_DIRS, skip_extensions=SKIP_EXTENSIONS):
+    """Yield (path, stat_result) for every file below root.
+
+    Hidden files and directories are skipped, as are directories named in
+    skip_dirs and files whose extension is in skip_extensions. The stat result
+    comes from the DirEntry, so no extra stat() call is made per file.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                name = entry.name
+                if name[:1] == '.':
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in skip_dirs:
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    dot = name.rfind('.')
+                    if dot < 0 or name[dot:] not in skip_extensions:
+                        yield entry.path, entry.stat(follow_symlinks=False)
+
+
+def collect(items, skip_dirs=SKIP_DIRS, skip_extensions=SKIP_EXTENSIONS):
+    """Resolve a list of files and directories into (path, stat_result) pairs.
+
+    Each listed item is stat()ed exactly once; directories are expanded with
+    scan(). Missing items are reported and skipped.
+    """
+    for item in items:
+        try:
+            st = os.stat(item)
+        except FileNotFoundError:
+            print(f"⚠ Warning: {item} not found")
+            continue
+        if stat.S_ISDIR(st.st_mode):
+            yield from scan(item, skip_dirs, skip_extensions)
+        else:
+            yield item, st
+
+
+def arcname_for(path, start='.'):
+    """Convert a path below start into a ZIP member name.
+
+    Paths produced by scan() and collect() are already joined onto start, so
+    stripping the prefix with a slice is enough; os.path.relpath would
+    re-normalise both paths for every file.
+    """
+    prefix = start + os.sep
+    if path.startswith(prefix):
+        path = path[len(prefix):]
+    return path.replace(os.sep, '/')
+
+
+def fast_copy(src, dst, st=None):
+    """Copy a file using the OS-native copy primitive.
+
+    Uses CopyFileExW on Windows and os.sendfile elsewhere, then restores the
+    access/modification times like shutil.copy2 would. Pass st when the
+    source stat result is already known to skip the extra stat() call.
+    """
+    if st is None:
+        st = os.stat(src)
+
+    if sys.platform == 'win32':
+        import ctypes
+        cancel = ctypes.c_int(0)
+        if not ctypes.windll.kernel32.CopyFileExW(src, dst, None, None, ctypes.byref(cancel), 0):
+            raise ctypes.WinError()
+    else:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+            offset = 0
+            try:
+                while offset < st.st_size:
+                    sent = os.sendfile(out_fd, in_fd, offset, 1 << 20)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                # sendfile() to a regular file is not supported everywhere (e.g. macOS)
+                if offset:
+                    raise
+                shutil.copyfileobj(fsrc, fdst)
+
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return dst
+
+
+def compress_type_for(name):
+    """Pick ZIP_STORED for already-compressed file types, ZIP_DEFLATED otherwise"""
+    dot = name.rfind('.')
+    if dot >= 0 and name[dot:].lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def make_zip_info(arc_path, st):
+    """Build a ZipInfo for a file from an already known stat result"""
+    date_time = time.localtime(st.st_mtime)[:6]
+    if date_time[0] < 1980:
+        # Same clamping ZipFile applies with strict_timestamps=False
+        date_time = (1980, 1, 1, 0, 0, 0)
+    zinfo = zipfile.ZipInfo(arc_path, date_time=date_time)
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    zinfo.compress_type = compress_type_for(arc_path)
+    return zinfo
+
+
+def _deflate_file(path, level=ZIP_LEVEL):
+    """Read and raw-deflate one file in a worker process.
+
+    Returns (payload, file_size, crc32) so the parent can build the ZipInfo.
+    Files of already-compressed types are returned unmodified.
+    """
+    with open(path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        data = f.read()
+
+    if compress_type_for(path) == zipfile.ZIP_STORED:
+        return data, len(data), zlib.crc32(data)
+
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    payload = compressor.compress(data) + compressor.flush()
+    return payload, len(data), zlib.crc32(data)
+
+
+# ZIP record layouts (APPNOTE 4.3); zipfile keeps its own copies private
+_LOCAL_HEADER = struct.Struct('<4s2B4HL2L2H')
+_CENTRAL_HEADER = struct.Struct('<4s4B4HL2L5H2L')
+_END_RECORD = struct.Struct('<4s4H2LH')
+_ZIP64_END_RECORD = struct.Struct('<4sQ2H2L4Q')
+_ZIP64_LOCATOR = struct.Struct('<4sLQL')
+
+# Sizes and offsets beyond this need ZIP64 records (same limit zipfile uses)
+_ZIP64_LIMIT = (1 << 31) - 1
+
+
+class _ZipWriter:
+    """Minimal ZIP writer for entries whose data is already compressed.
+
+    zipfile.ZipFile only writes data it compresses itself, so entries
+    deflated by worker processes or copied from a previous archive are
+    written here instead, with the header carrying the final CRC and sizes.
+    """
+    
+    def __init__(self, fp):
+        self.fp = fp
+        self._entries = []
+    
+    @staticmethod
+    def _encode_name(zinfo):
+        """Return the entry name as bytes and the flag bits it needs"""
+        try:
+            return zinfo.filename.encode('ascii'), 0
+        except UnicodeEncodeError:
+            return zinfo.filename.encode('utf-8'), 0x800
+    
+    @staticmethod
+    def _dos_date_time(zinfo):
+        """Pack the entry's timestamp into MS-DOS date and time fields"""
+        year, month, day, hour, minute, second = zinfo.date_time
+        return (year - 1980) << 9 | month << 5 | day, hour << 11 | minute << 5 | second // 2
+    
+    def _local_header(self, zinfo, name, flags, zip64):
+        """Build the local file header for an entry"""
+        file_size, compress_size = zinfo.file_size, zinfo.compress_size
+        extra = b''
+        version = 20
+        if zip64:
+            extra = struct.pack('<2H2Q', 1, 16, file_size, compress_size)
+            file_size = compress_size = 0xFFFFFFFF
+            version = 45
+        dos_date, dos_time = self._dos_date_time(zinfo)
+        return _LOCAL_HEADER.pack(b'PK\x03\x04', version, 0, flags, zinfo.compress_type,
+                                  dos_time, dos_date, zinfo.CRC, compress_size, file_size,
+                                  len(name), len(extra)) + name + extra
+    
+    def write(self, zinfo, payload):
+        """Append an entry whose payload is already encoded and whose CRC/sizes are set"""
+        name, flags = self._encode_name(zinfo)
+        zip64 = zinfo.file_size > _ZIP64_LIMIT or zinfo.compress_size > _ZIP64_LIMIT
+        zinfo.header_offset = self.fp.tell()
+        self.fp.write(self._local_header(zinfo, name, flags, zip64))
+        self.fp.write(payload)
+        self._entries.append((zinfo, name, flags))
+    
+    def write_stream(self, zinfo, src, level=ZIP_LEVEL):
+        """Compress a file object into a new entry chunk by chunk.
+        
+        The header is written with placeholder values and rewritten once the
+        CRC and sizes are known, so the file is never held in memory as a whole.
+        """
+        name, flags = self._encode_name(zinfo)
+        # Decide on ZIP64 up front so the rewritten header has the same length
+        zip64 = zinfo.file_size * 1.05 > _ZIP64_LIMIT
+        zinfo.CRC = zinfo.compress_size = 0
+        zinfo.header_offset = self.fp.tell()
+        self.fp.write(self._local_header(zinfo, name, flags, zip64))
+        
+        compressor = None
+        if zinfo.compress_type == zipfile.ZIP_DEFLATED:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        crc = file_size = compress_size = 0
+        while True:
+            chunk = src.read(READ_BUFFER_SIZE)
+            if not chunk:
+                break
+            crc = zlib.crc32(chunk, crc)
+            file_size += len(chunk)
+            if compressor is not None:
+                chunk = compressor.compress(chunk)
+            compress_size += len(chunk)
+            self.fp.write(chunk)
+        if compressor is not None:
+            chunk = compressor.flush()
+            compress_size += len(chunk)
+            self.fp.write(chunk)
+        
+        zinfo.CRC, zinfo.file_size, zinfo.compress_size = crc, file_size, compress_size
+        if not zip64 and (file_size > _ZIP64_LIMIT or compress_size > _ZIP64_LIMIT):
+            raise ValueError(f"{zinfo.filename} grew past the ZIP64 limit while being written")
+        end = self.fp.tell()
+        self.fp.seek(zinfo.header_offset)
+        self.fp.write(self._local_header(zinfo, name, flags, zip64))
+        self.fp.seek(end)
+        self._entries.append((zinfo, name, flags))
+    
+    def close(self):
+        """Write the central directory and end records"""
+        fp = self.fp
+        directory_offset = fp.tell()
+        for zinfo, name, flags in self._entries:
+            file_size, compress_size, header_offset = zinfo.file_size, zinfo.compress_size, zinfo.header_offset
+            zip64_fields = []
+            if file_size > _ZIP64_LIMIT or compress_size > _ZIP64_LIMIT:
+                zip64_fields += [file_size, compress_size]
+                file_size = compress_size = 0xFFFFFFFF
+            if header_offset > _ZIP64_LIMIT:
+                zip64_fields.append(header_offset)
+                header_offset = 0xFFFFFFFF
+            extra = b''
+            version = 20
+            if zip64_fields:
+                extra = struct.pack(f'<2H{len(zip64_fields)}Q', 1, 8 * len(zip64_fields), *zip64_fields)
+                version = 45
+            dos_date, dos_time = self._dos_date_time(zinfo)
+            fp.write(_CENTRAL_HEADER.pack(b'PK\x01\x02', version, zinfo.create_system, version, 0,
+                                          flags, zinfo.compress_type, dos_time, dos_date, zinfo.CRC,
+                                          compress_size, file_size, len(name), len(extra), 0, 0,
+                                          zinfo.internal_attr, zinfo.external_attr, header_offset))
+            fp.write(name)
+            fp.write(extra)
+        
+        directory_size = fp.tell() - directory_offset
+        count = len(self._entries)
+        if count >= 0xFFFF or directory_offset > _ZIP64_LIMIT or directory_size > _ZIP64_LIMIT:
+            zip64_end_offset = fp.tell()
+            fp.write(_ZIP64_END_RECORD.pack(b'PK\x06\x06', _ZIP64_END_RECORD.size - 12, 45, 45,
+                                            0, 0, count, count, directory_size, directory_offset))
+            fp.write(_ZIP64_LOCATOR.pack(b'PK\x06\x07', 0, zip64_end_offset, 1))
+            count = min(count, 0xFFFF)
+            directory_size = min(directory_size, 0xFFFFFFFF)
+            directory_offset = min(directory_offset, 0xFFFFFFFF)
+        fp.write(_END_RECORD.pack(b'PK\x05\x06', 0, 0, count, count,
+                                  directory_size, directory_offset, 0))
+
+
+def _read_raw(fp, zinfo):
+    """Read an entry's compressed bytes from an archive opened with open(path, 'rb')"""
+    fp.seek(zinfo.header_offset)
+    header = _LOCAL_HEADER.unpack(fp.read(_LOCAL_HEADER.size))
+    if header[0] != b'PK\x03\x04':
+        raise zipfile.BadZipFile(f"Bad local file header for {zinfo.filename}")
+    # Skip the local header's file name and extra field (fields 10 and 11)
+    fp.seek(header[10] + header[11], os.SEEK_CUR)
+    return fp.read(zinfo.compress_size)
+
+
+class _ReleaseCache:
+    """Remembers which archive already holds a compressed copy of each file.
+
+    Records are keyed by absolute path and only reused while the file's
+    mtime, size and the deflate level are unchanged, so rebuilding after an
+    edit only recompresses the files that actually changed.
+    """
+    
+    def __init__(self, cache_path=RELEASE_CACHE_FILE):
+        self.cache_path = cache_path
+        self.files = {}
+        self._archives = {}
+    
+    def load(self):
+        """Load records from disk; a missing or corrupt cache starts empty"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                self.files = json.load(f)
+        except (OSError, ValueError):
+            self.files = {}
+        return self
+    
+    def save(self):
+        """Persist records to disk"""
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(self.files, f)
+    
+    def remember(self, entries, zip_path):
+        """Record that zip_path holds compressed copies of (path, arcname, stat) entries"""
+        zip_path = os.path.abspath(zip_path)
+        for path, arc_path, st in entries:
+            self.files[os.path.abspath(path)] = [st.st_mtime_ns, st.st_size, ZIP_LEVEL, zip_path, arc_path]
+    
+    def forget(self, zip_paths):
+        """Drop records pointing into any of the given archives"""
+        zip_paths = {os.path.abspath(path) for path in zip_paths}
+        self.files = {path: record for path, record in self.files.items()
+                      if record[3] not in zip_paths}
+    
+    def lookup(self, path, st):
+        """Return (archive file, ZipInfo) holding an unchanged copy of path, or None"""
+        record = self.files.get(os.path.abspath(path))
+        if not record or record[:3] != [st.st_mtime_ns, st.st_size, ZIP_LEVEL]:
+            return None
+        zip_path, arc_path = record[3], record[4]
+        try:
+            archive = self._archives.get(zip_path)
+            if archive is None:
+                # ZipFile only supplies the entry metadata; _read_raw reads the
+                # compressed bytes through a plain file handle
+                with zipfile.ZipFile(zip_path) as zf:
+                    infos = {info.filename: info for info in zf.infolist()}
+                archive = self._archives[zip_path] = (open(zip_path, 'rb'), infos)
+            fp, infos = archive
+            return fp, infos[arc_path]
+        except (OSError, KeyError, zipfile.BadZipFile):
+            return None
+    
+    def close(self):
+        """Close any previous archives opened by lookup()"""
+        for fp, _ in self._archives.values():
+            fp.close()
+        self._archives.clear()
+
+
+@contextmanager
+def open_zip(zip_path):
+    """Create a new deflated ZIP archive backed by a large write buffer"""
+    with open(zip_path, 'wb', buffering=WRITE_BUFFER_SIZE) as fp:
+        with zipfile.ZipFile(fp, 'w', zipfile.ZIP_DEFLATED, allowZip64=True,
+                             compresslevel=ZIP_LEVEL, strict_timestamps=False) as zf:
+            yield zf
+
+
+def write_source_zip(zip_path, entries, release_cache=None):
+    """Write (path, arcname, stat) entries into a new deflated ZIP archive.
+
+    Files are read and compressed in parallel worker processes; the results
+    are appended to the archive in their original order by this process.
+    Small inputs are compressed inline, where starting a pool would cost more
+    than it saves. Files larger than STREAM_THRESHOLD are streamed straight
+    into the archive so they are never held in memory as a whole. When a
+    release_cache is given, unchanged files have their compressed bytes
+    copied from the previous archive instead of being compressed again.
+    """
+    reused = {}
+    if release_cache is not None:
+        for index, (path, _, st) in enumerate(entries):
+            hit = release_cache.lookup(path, st)
+            if hit:
+                reused[index] = hit
+
+    paths = [path for index, (path, _, st) in enumerate(entries)
+             if index not in reused and st.st_size <= STREAM_THRESHOLD]
+    if len(paths) > COMPRESS_CHUNKSIZE:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_deflate_file, paths, chunksize=COMPRESS_CHUNKSIZE))
+    else:
+        results = [_deflate_file(path) for path in paths]
+    results = iter(results)
+
+    with open(zip_path, 'wb', buffering=WRITE_BUFFER_SIZE) as fp:
+        writer = _ZipWriter(fp)
+        for index, (path, arc_path, st) in enumerate(entries):
+            zinfo = make_zip_info(arc_path, st)
+            if index in reused:
+                previous_fp, previous = reused[index]
+                zinfo.compress_type = previous.compress_type
+                zinfo.file_size = previous.file_size
+                zinfo.compress_size = previous.compress_size
+                zinfo.CRC = previous.CRC
+                writer.write(zinfo, _read_raw(previous_fp, previous))
+                continue
+
+            if st.st_size > STREAM_THRESHOLD:
+                with open(path, 'rb', buffering=READ_BUFFER_SIZE) as src:
+                    writer.write_stream(zinfo, src)
+                continue
+
+            payload, file_size, crc = next(results)
+            zinfo.file_size = file_size
+            zinfo.compress_size = len(payload)
+            zinfo.CRC = crc
+            writer.write(zinfo, payload)
+        writer.close()
+    return zip_path
+
+
+def input_digest(items, salt=''):
+    """Hex BLAKE2b digest of (name, stat_result) pairs' names, mtimes and sizes"""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(f"{salt}\0".encode())
+    for name, st in sorted(items, key=lambda item: item[0]):
+        digest.update(f"{name}|{st.st_mtime_ns}|{st.st_size}\0".encode())
+    return digest.hexdigest()
+
+
+def cached_source_zip(entries):
+    """Return the path of a source archive for (path, arcname, stat) entries.
+
+    Archives are cached in CACHE_DIR under a key derived from every entry's
+    name, mtime and size, so identical inputs are only compressed once per
+    tree. When some inputs changed, the compressed bytes of the unchanged
+    ones are reused from earlier archives via RELEASE_CACHE_FILE.
+    """
+    digest = input_digest(((arc_path, st) for _, arc_path, st in entries), f"level={ZIP_LEVEL}")
+    cached_zip = os.path.join(CACHE_DIR, f"{digest}.zip")
+
+    if not os.path.exists(cached_zip):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        partial_zip = cached_zip + '.partial'
+        release_cache = _ReleaseCache().load()
+        try:
+            write_source_zip(partial_zip, entries, release_cache)
+        finally:
+            release_cache.close()
+        os.replace(partial_zip, cached_zip)
+        release_cache.remember(entries, cached_zip)
+        release_cache.forget(prune_cache(cached_zip))
+        release_cache.save()
+    else:
+        # Mark the hit as recently used so pruning keeps it
+        os.utime(cached_zip)
+    return cached_zip
+
+
+def prune_cache(current_zip, keep=CACHE_KEEP):
+    """Delete all but the newest keep archives in CACHE_DIR, never current_zip.
+
+    Leftover .partial files from interrupted builds are removed as well.
+    Returns the paths of the deleted archives.
+    """
+    archives = []
+    removed = []
+    with os.scandir(CACHE_DIR) as it:
+        for entry in it:
+            if entry.name.endswith('.partial'):
+                removed.append(entry.path)
+            elif entry.name.endswith('.zip') and entry.path != current_zip:
+                archives.append((entry.stat().st_mtime_ns, entry.path))
+    archives.sort(reverse=True)
+    removed.extend(path for _, path in archives[max(keep - 1, 0):])
+    for path in removed:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return removed
+
+
+def build_source_zip(zip_path, entries):
+    """Place a source archive for (path, arcname, stat) entries at zip_path.
+
+    The cached archive from cached_source_zip() is hard-linked into place, or
+    copied when linking is not possible (e.g. across devices).
+    """
+    cached_zip = cached_source_zip(entries)
+    if os.path.exists(zip_path):
+        os.remove(zip_path)
+    try:
+        os.link(cached_zip, zip_path)
+    except OSError:
+        fast_copy(cached_zip, zip_path)
+    return zip_path
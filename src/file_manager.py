@@ -3,13 +3,20 @@ File management module for handling image import, export, and file operations.
 Supports drag-drop, batch import, and various file format operations.
 """
 
+import hashlib
+import heapq
+import logging
 import os
+import re
 import shutil
-from typing import List, Optional, Tuple, Dict
+import stat
+import threading
+import time
+from types import ModuleType
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple, Dict, Iterable, Iterator, Final, TYPE_CHECKING
 from pathlib import Path
-import tkinter as tk
-from tkinter import filedialog, messagebox
-from PIL import Image
 import sys
 import platform
 
@@ -26,136 +33,517 @@ if platform.system() == "Windows":
 else:
     WINDOWS_DND_AVAILABLE = False
 
+# PIL and tkinter are imported where they are used, so path handling
+# (imports, validation, naming) works without loading either
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Per-file drag-drop tracing goes to debug logging so large drops do not
+# flood stdout; one-line summaries are still printed
+log = logging.getLogger(__name__)
+
+# Constants used in per-file loops, resolved once at import time
+_IMAGE_SUFFIXES: Final = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif')
+_MAX_SUFFIX_LEN: Final = 5  # len('.jpeg'), len('.tiff')
+
+# Extension written for each output format, and the input extensions
+# that preserve_original keeps unchanged for it
+_FORMAT_EXT: Final = {'JPEG': '.jpg', 'PNG': '.png'}
+_KEEP_EXTENSIONS: Final = {'.jpg': ('.jpg', '.jpeg'), '.png': ('.png',)}
+
+_SIZE_UNITS: Final = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Characters that may wrap a dropped path (quotes from the shell, braces from Tcl)
+_PATH_WRAPPERS: Final = '"\'{}'
+
+# Threads used to walk top-level subfolders in a parallel recursive import
+_SCAN_WORKERS: Final = 8
+
+# Numbered backup names (photo_1.jpg ...) tried before falling back to a timestamp
+_MAX_BACKUP_COUNTER: Final = 100
+
+# Leading bytes of the supported formats: JPEG, PNG, BMP, little/big-endian TIFF
+_IMAGE_MAGIC: Final = (b'\xff\xd8', b'\x89PNG\r\n\x1a\n', b'BM', b'II*\x00', b'MM\x00*')
+
+# Thumbnails are cached on disk as JPEGs named after a hash of the source
+# path, mtime and size, so edited or replaced files miss the cache
+_THUMB_CACHE_DIR: Final = os.path.join(os.path.expanduser('~'), '.cache', 'photo-homework', 'thumbs')
+_THUMB_CACHE_QUALITY: Final = 80
+
+# Size limit of the thumbnail cache; the least recently used thumbnails are
+# deleted down to 3/4 of it on the first write of a session and every
+# _THUMB_PRUNE_INTERVAL writes after that
+_THUMB_CACHE_MAX_BYTES: Final = 256 * 1024 * 1024
+_THUMB_PRUNE_INTERVAL: Final = 500
+
+# Tokens of a Tcl list of dropped paths: {brace quoted}, "double quoted" or bare
+_DND_TOKEN: Final = re.compile(r'\{([^}]*)\}|"([^"]*)"|(\S+)')
+
+# The same paths are normalised over and over during import, validation and
+# export; the application never changes its working directory, so results
+# of abspath stay valid for the cache's lifetime
+@lru_cache(maxsize=8192)
+def _normalize_path(file_path: str) -> str:
+    """Normalise a path so different spellings of the same file compare equal"""
+    return os.path.normcase(os.path.abspath(file_path))
+
+@lru_cache(maxsize=8192)
+def _split_filename(file_path: str) -> Tuple[str, str]:
+    """Split the file name of a path into base name and extension"""
+    return os.path.splitext(os.path.basename(file_path))
+
+@lru_cache(maxsize=None)
+def _load_windnd() -> Optional[ModuleType]:
+    """Import the optional windnd package once, returning None when it is not installed"""
+    try:
+        import windnd
+    except ImportError:
+        return None
+    return windnd
+
+@lru_cache(maxsize=None)
+def _load_pyvips() -> Optional[ModuleType]:
+    """Import the optional pyvips package once, returning None when it is not available"""
+    try:
+        import pyvips  # pyright: ignore[reportMissingImports]
+    except (ImportError, OSError):
+        # OSError: the Python binding is installed but libvips itself is not
+        return None
+    return pyvips
+
+@lru_cache(maxsize=None)
+def _load_xxhash() -> Optional[ModuleType]:
+    """Import the optional xxhash package once, returning None when it is not installed"""
+    try:
+        import xxhash  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+    return xxhash
+
+def _thumb_cache_path(file_path: str, st: os.stat_result, thumbnail_size: Tuple[int, int]) -> str:
+    """Return the disk cache file of a thumbnail of file_path at thumbnail_size"""
+    key = f"{_normalize_path(file_path)}|{st.st_mtime_ns}|{st.st_size}|{thumbnail_size[0]}x{thumbnail_size[1]}"
+    xxhash = _load_xxhash()
+    if xxhash is not None:
+        digest = xxhash.xxh64(key.encode('utf-8')).hexdigest()
+    else:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
+    return os.path.join(_THUMB_CACHE_DIR, f"{digest}.jpg")
+
+def _parse_thumb_comment(comment) -> Optional[Tuple[Tuple[int, int], str, Optional[str]]]:
+    """Parse the source header ("WxH mode format") stored in a cached thumbnail's comment"""
+    try:
+        size, mode, image_format = os.fsdecode(comment).split(' ')
+        width, height = map(int, size.split('x'))
+    except (TypeError, ValueError):
+        return None
+    return (width, height), mode, image_format or None
+
+# Cache writes so far, shared by the GUI's thumbnail worker threads
+_thumb_writes = 0
+_thumb_writes_lock = threading.Lock()
+
+def _prune_thumb_cache(max_bytes: int = _THUMB_CACHE_MAX_BYTES):
+    """Delete the least recently used cached thumbnails once the cache exceeds max_bytes"""
+    files = []
+    total = 0
+    try:
+        with os.scandir(_THUMB_CACHE_DIR) as it:
+            for entry in it:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                files.append((max(st.st_atime, st.st_mtime), st.st_size, entry.path))
+                total += st.st_size
+    except OSError:
+        return
+    
+    if total <= max_bytes:
+        return
+    target = max_bytes * 3 // 4
+    for _, size, path in sorted(files):
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= target:
+            break
+
+def _copy_file(src: str, dst: str):
+    """Copy file data in the kernel where possible (reflink/copy_file_range), then its metadata"""
+    copied_in_kernel = False
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        # Some filesystems report no progress instead of failing
+                        break
+                    remaining -= copied
+            copied_in_kernel = remaining == 0
+        except OSError:
+            pass
+    
+    if not copied_in_kernel:
+        # shutil.copyfile uses sendfile on Linux and CopyFile2 on Windows;
+        # it truncates whatever a partial kernel copy left behind
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
 class FileManager:
     """Handles all file operations for the watermark application"""
     
-    # Supported file extensions
-    SUPPORTED_EXTENSIONS = {
-        '.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'
-    }
+    __slots__ = ('imported_files', '_imported_stats', '_input_dirs', '_info_cache',
+                 'output_directory', 'prevent_overwrite')
+    
+    # Supported file extensions (read-only; is_image_file matches _IMAGE_SUFFIXES)
+    SUPPORTED_EXTENSIONS = frozenset(_IMAGE_SUFFIXES)
     
     OUTPUT_FORMATS = {
         'JPEG': ['.jpg', '.jpeg'],
         'PNG': ['.png']
     }
     
+    # File type filters offered by the file selection dialog
+    _FILE_TYPES = (
+        ("All Supported Images", "*.jpg;*.jpeg;*.png;*.bmp;*.tiff;*.tif"),
+        ("JPEG files", "*.jpg;*.jpeg"),
+        ("PNG files", "*.png"),
+        ("BMP files", "*.bmp"),
+        ("TIFF files", "*.tiff;*.tif"),
+        ("All files", "*.*")
+    )
+    
     def __init__(self):
         self.imported_files = []  # List of imported file paths
+        # Normalised path -> os.stat_result of each imported file, also used for O(1) lookups
+        self._imported_stats = {}
+        # Normalised directory -> number of imported files in it
+        self._input_dirs = {}
+        # Normalised path -> (st_mtime_ns, st_size, info) of get_image_info results
+        self._info_cache = {}
         self.output_directory = ""
         self.prevent_overwrite = True
     
-    def is_image_file(self, file_path: str) -> bool:
-        """Check if file is a supported image format"""
-        _, ext = os.path.splitext(file_path.lower())
-        return ext in self.SUPPORTED_EXTENSIONS
+    _path_key = staticmethod(_normalize_path)
+    
+    def is_image_file(self, file_path: str, sniff: bool = False) -> bool:
+        """Check if file is a supported image format, optionally sniffing files without an extension"""
+        # Only lowercase the tail instead of the whole path
+        if file_path[-_MAX_SUFFIX_LEN:].lower().endswith(_IMAGE_SUFFIXES):
+            return True
+        return sniff and not os.path.splitext(file_path)[1] and self._sniff_image(file_path)
+    
+    @staticmethod
+    def _sniff_image(file_path: str) -> bool:
+        """Check the leading bytes of a file against the supported image signatures"""
+        try:
+            with open(file_path, 'rb') as f:
+                return f.read(8).startswith(_IMAGE_MAGIC)
+        except OSError:
+            return False
+    
+    def _file_stat(self, file_path: str) -> os.stat_result:
+        """Return the stat captured at import time, or stat the file now"""
+        st = self._imported_stats.get(self._path_key(file_path))
+        return st if st is not None else os.stat(file_path)
+    
+    def get_file_info(self, file_path: str) -> Optional[Dict]:
+        """Get file name, size and modification time without opening the image"""
+        try:
+            st = self._file_stat(file_path)
+        except OSError as e:
+            print(f"Error getting file info for {file_path}: {e}")
+            return None
+        return self._file_info(file_path, st)
+    
+    @staticmethod
+    def _file_info(file_path: str, st: os.stat_result) -> Dict:
+        """Build the file information dict from a stat result"""
+        return {
+            'path': file_path,
+            'filename': os.path.basename(file_path),
+            'file_size': st.st_size,
+            'mtime': st.st_mtime
+        }
     
     def get_image_info(self, file_path: str) -> Optional[Dict]:
-        """Get basic information about an image file"""
+        """Get file information plus dimensions, mode and format read from the image header"""
+        if not self.is_image_file(file_path):
+            return None
+        
+        # A fresh stat is far cheaper than reopening the image and tells us
+        # whether the cached header information is still valid
         try:
-            if not self.is_image_file(file_path):
-                return None
+            st = os.stat(file_path)
+        except OSError as e:
+            print(f"Error getting image info for {file_path}: {e}")
+            return None
+        
+        key = self._path_key(file_path)
+        cached = self._info_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return dict(cached[2])
+        
+        try:
+            from PIL import Image
             
+            # Image.open only parses the header; pixel data is never loaded here
             with Image.open(file_path) as img:
-                info = {
-                    'path': file_path,
-                    'filename': os.path.basename(file_path),
-                    'size': img.size,
-                    'mode': img.mode,
-                    'format': img.format,
-                    'file_size': os.path.getsize(file_path)
-                }
-                return info
+                return dict(self._remember_header(file_path, img, st))
         except Exception as e:
             print(f"Error getting image info for {file_path}: {e}")
             return None
     
-    def import_single_file(self, file_path: str) -> bool:
-        """Import a single image file"""
-        if not os.path.exists(file_path):
+    def _remember_header(self, file_path: str, img: 'Image.Image',
+                         st: Optional[os.stat_result] = None) -> Dict:
+        """Cache the header information of an opened image for get_image_info"""
+        if st is None:
+            st = os.stat(file_path)
+        return self._cache_header(file_path, st, img.size, img.mode, img.format)
+    
+    def _cache_header(self, file_path: str, st: os.stat_result, size: Tuple[int, int],
+                      mode: str, image_format: Optional[str]) -> Dict:
+        """Store header information for file_path as of stat result st"""
+        info = self._file_info(file_path, st)
+        info['size'] = size
+        info['mode'] = mode
+        info['format'] = image_format
+        self._info_cache[self._path_key(file_path)] = (st.st_mtime_ns, st.st_size, info)
+        return info
+    
+    def import_single_file(self, file_path: str, st: Optional[os.stat_result] = None,
+                           sniff: bool = False) -> bool:
+        """Import a single image file, optionally with a stat already taken by the caller"""
+        if not self.is_image_file(file_path, sniff):
             return False
         
-        if not self.is_image_file(file_path):
+        key = self._path_key(file_path)
+        if key in self._imported_stats:
             return False
         
-        if file_path not in self.imported_files:
-            self.imported_files.append(file_path)
-            return True
-        return False
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return False
+        
+        self.imported_files.append(file_path)
+        self._imported_stats[key] = st
+        input_dir = os.path.dirname(key)
+        self._input_dirs[input_dir] = self._input_dirs.get(input_dir, 0) + 1
+        return True
     
     def import_multiple_files(self, file_paths: List[str]) -> List[str]:
         """Import multiple image files, returns list of successfully imported files"""
-        imported = []
-        for file_path in file_paths:
-            if self.import_single_file(file_path):
-                imported.append(file_path)
-        return imported
+        return self.import_paths(file_paths)
     
-    def import_folder(self, folder_path: str, recursive: bool = False) -> List[str]:
+    def import_paths(self, file_paths: Iterable) -> List[str]:
+        """Import many image files (str or path-like) in one pass, returns the newly imported paths"""
+        imported_stats = self._imported_stats
+        input_dirs = self._input_dirs
+        is_image_file = self.is_image_file
+        new_files = []
+        
+        for file_path in map(os.fspath, file_paths):
+            if not is_image_file(file_path):
+                continue
+            
+            key = _normalize_path(file_path)
+            if key in imported_stats:
+                continue
+            
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            
+            imported_stats[key] = st
+            input_dir = os.path.dirname(key)
+            input_dirs[input_dir] = input_dirs.get(input_dir, 0) + 1
+            new_files.append(file_path)
+        
+        # Grow the ordered list once for the whole batch
+        self.imported_files.extend(new_files)
+        return new_files
+    
+    def import_folder(self, folder_path: str, recursive: bool = False,
+                      parallel: bool = False, inode_order: bool = False) -> List[str]:
         """Import all image files from a folder"""
-        imported = []
+        # Recursive walk options: parallel lists top-level subfolders concurrently
+        # (network shares), inode_order visits subfolders by inode (hard disks)
+        return list(self.iter_import_folder(folder_path, recursive, parallel, inode_order))
+    
+    def _scan_dir(self, directory: str, recursive: bool) -> Tuple[List[os.DirEntry], List[os.DirEntry]]:
+        """List one directory, returning its image file entries and (when recursing) its subdirectories"""
+        # DirEntry caches the file type (and on Windows the stat) from the
+        # directory read, so no per-entry stat() is needed
+        images = []
+        subdirs = []
+        # Bind per-entry lookups once for the loop
+        is_image_file = self.is_image_file
+        add_image = images.append
+        add_subdir = subdirs.append
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Filter on the name first, like glob's literal-suffix fast path, so
+                    # non-image entries never need their type checked when not recursing
+                    if is_image_file(entry.name) and entry.is_file():
+                        add_image(entry)
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        add_subdir(entry)
+        except OSError as e:
+            # Skip unreadable directories like os.walk does, keeping whatever was listed
+            log.debug("Skipping unreadable directory %s: %s", directory, e)
+        return images, subdirs
+    
+    def _scan_images(self, folder_path: str, recursive: bool = False,
+                     parallel: bool = False, inode_order: bool = False) -> Iterator[List[os.DirEntry]]:
+        """Walk a folder with os.scandir, yielding the image file entries of each directory"""
+        if parallel and recursive:
+            yield from self._scan_images_parallel(folder_path)
+            return
         
-        if not os.path.exists(folder_path) or not os.path.isdir(folder_path):
-            return imported
+        if inode_order and recursive:
+            yield from self._scan_images_by_inode(folder_path)
+            return
+        
+        pending = [folder_path]
+        while pending:
+            images, subdirs = self._scan_dir(pending.pop(), recursive)
+            if images:
+                yield images
+            # Visit subdirectories in listing order, like os.walk
+            pending.extend(reversed([entry.path for entry in subdirs]))
+    
+    def _scan_images_by_inode(self, folder_path: str) -> Iterator[List[os.DirEntry]]:
+        """Recursive _scan_images that visits directories in inode order"""
+        # On spinning disks inode numbers roughly follow on-disk placement, so
+        # always reading the lowest pending inode next cuts seek distance;
+        # DirEntry.inode() comes free with the directory read on POSIX
+        pending = [(0, folder_path)]
+        while pending:
+            _, directory = heapq.heappop(pending)
+            images, subdirs = self._scan_dir(directory, True)
+            if images:
+                yield images
+            for entry in subdirs:
+                heapq.heappush(pending, (entry.inode(), entry.path))
+    
+    def _scan_images_parallel(self, folder_path: str) -> Iterator[List[os.DirEntry]]:
+        """Recursive _scan_images that walks each top-level subdirectory on its own thread"""
+        images, subdirs = self._scan_dir(folder_path, True)
+        if images:
+            yield images
+        if not subdirs:
+            return
+        
+        subdirs = [entry.path for entry in subdirs]
+        
+        def scan_subtree(subdir):
+            batches = list(self._scan_images(subdir, True))
+            # Warm each DirEntry's stat cache here rather than on the importing thread
+            for batch in batches:
+                for entry in batch:
+                    try:
+                        entry.stat()
+                    except OSError:
+                        # iter_import_folder skips the entry when it stats it again
+                        pass
+            return batches
+        
+        # scandir and stat release the GIL, so subtrees on slow or network
+        # filesystems are listed concurrently; map keeps the serial walk's order
+        with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(subdirs))) as executor:
+            for batches in executor.map(scan_subtree, subdirs):
+                yield from batches
+    
+    def iter_import_folder(self, folder_path: str, recursive: bool = False,
+                           parallel: bool = False, inode_order: bool = False) -> Iterator[str]:
+        """Import image files from a folder, yielding the new paths of each directory once it is scanned"""
+        if not os.path.isdir(folder_path):
+            return
         
         try:
-            if recursive:
-                # Recursively find all image files
-                for root, dirs, files in os.walk(folder_path):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        if self.import_single_file(file_path):
-                            imported.append(file_path)
-            else:
-                # Only scan the immediate directory
-                for file in os.listdir(folder_path):
-                    file_path = os.path.join(folder_path, file)
-                    if os.path.isfile(file_path) and self.import_single_file(file_path):
-                        imported.append(file_path)
+            imported_stats = self._imported_stats
+            for images in self._scan_images(folder_path, recursive, parallel, inode_order):
+                added = []
+                for entry in images:
+                    key = _normalize_path(entry.path)
+                    if key in imported_stats:
+                        continue
+                    try:
+                        imported_stats[key] = entry.stat()
+                    except OSError:
+                        # Removed or made unreadable since the directory was listed
+                        continue
+                    added.append(entry.path)
+                
+                # Register the whole directory at once: every file shares the same input dir
+                if added:
+                    self.imported_files.extend(added)
+                    input_dir = os.path.dirname(self._path_key(added[0]))
+                    self._input_dirs[input_dir] = self._input_dirs.get(input_dir, 0) + len(added)
+                    yield from added
         except Exception as e:
             print(f"Error importing folder {folder_path}: {e}")
-        
-        return imported
     
     def remove_file(self, file_path: str) -> bool:
         """Remove a file from the imported list"""
-        if file_path in self.imported_files:
-            self.imported_files.remove(file_path)
-            return True
-        return False
+        key = self._path_key(file_path)
+        if key not in self._imported_stats:
+            return False
+        
+        del self._imported_stats[key]
+        self._info_cache.pop(key, None)
+        input_dir = os.path.dirname(key)
+        if self._input_dirs[input_dir] > 1:
+            self._input_dirs[input_dir] -= 1
+        else:
+            del self._input_dirs[input_dir]
+        for i, imported_path in enumerate(self.imported_files):
+            if imported_path == file_path or self._path_key(imported_path) == key:
+                del self.imported_files[i]
+                break
+        return True
     
     def clear_all_files(self):
         """Clear all imported files"""
         self.imported_files.clear()
+        self._imported_stats.clear()
+        self._input_dirs.clear()
+        self._info_cache.clear()
+        _normalize_path.cache_clear()
+        _split_filename.cache_clear()
     
     def get_imported_files(self) -> List[str]:
         """Get list of imported file paths"""
         return self.imported_files.copy()
     
     def get_imported_files_info(self) -> List[Dict]:
-        """Get detailed information about all imported files"""
-        info_list = []
+        """Get name, size and mtime of all imported files from the stats cached at import"""
+        return list(self.iter_imported_files_info())
+    
+    def iter_imported_files_info(self) -> Iterator[Dict]:
+        """Yield the file information of imported files one at a time"""
         for file_path in self.imported_files:
-            info = self.get_image_info(file_path)
+            info = self.get_file_info(file_path)
             if info:
-                info_list.append(info)
-        return info_list
+                yield info
     
     def select_files_dialog(self, parent=None) -> List[str]:
         """Open file dialog to select multiple image files"""
-        file_types = [
-            ("All Supported Images", "*.jpg;*.jpeg;*.png;*.bmp;*.tiff;*.tif"),
-            ("JPEG files", "*.jpg;*.jpeg"),
-            ("PNG files", "*.png"),
-            ("BMP files", "*.bmp"),
-            ("TIFF files", "*.tiff;*.tif"),
-            ("All files", "*.*")
-        ]
-        
         try:
+            from tkinter import filedialog
             file_paths = filedialog.askopenfilenames(
                 parent=parent,
                 title="Select Image Files",
-                filetypes=file_types
+                filetypes=self._FILE_TYPES
             )
             return list(file_paths) if file_paths else []
         except Exception as e:
@@ -165,6 +553,7 @@ class FileManager:
     def select_folder_dialog(self, parent=None) -> str:
         """Open folder dialog to select a directory"""
         try:
+            from tkinter import filedialog
             folder_path = filedialog.askdirectory(
                 parent=parent,
                 title="Select Folder"
@@ -177,6 +566,7 @@ class FileManager:
     def select_output_directory(self, parent=None) -> str:
         """Select output directory for processed images"""
         try:
+            from tkinter import filedialog
             folder_path = filedialog.askdirectory(
                 parent=parent,
                 title="Select Output Directory"
@@ -207,44 +597,42 @@ class FileManager:
             return False, "No write permission for output directory"
         
         # Check if output directory is same as any input directory (prevent overwrite)
-        if self.prevent_overwrite:
-            for file_path in self.imported_files:
-                file_dir = os.path.dirname(os.path.abspath(file_path))
-                if os.path.abspath(output_dir) == file_dir:
-                    return False, "Output directory cannot be the same as input directory to prevent overwriting"
+        if self.prevent_overwrite and self._path_key(output_dir) in self._input_dirs:
+            return False, "Output directory cannot be the same as input directory to prevent overwriting"
         
         return True, "Output directory is valid"
     
-    def generate_output_filename(self, input_path: str, prefix: str = "", 
-                                suffix: str = "", output_format: str = "JPEG", 
-                                preserve_original: bool = False) -> str:
-        """Generate output filename based on naming rules"""
-        base_name = os.path.splitext(os.path.basename(input_path))[0]
+    def _output_extension(self, output_format: str) -> str:
+        """Get the extension written for an output format (anything but JPEG is PNG)"""
+        return _FORMAT_EXT.get(output_format.upper(), '.png')
+    
+    def output_filename_generator(self, prefix: str = "", suffix: str = "",
+                                  output_format: str = "JPEG",
+                                  preserve_original: bool = False) -> Callable[[str], str]:
+        """Bind the naming rules once and return a function mapping an input path to its output filename"""
+        ext = self._output_extension(output_format)
         
         if preserve_original:
             # Keep original filename, just change extension if needed
-            original_ext = os.path.splitext(os.path.basename(input_path))[1].lower()
-            if output_format.upper() == "JPEG":
-                if original_ext not in ['.jpg', '.jpeg']:
-                    new_name = base_name + ".jpg"
-                else:
-                    new_name = os.path.basename(input_path)  # Keep original extension
-            else:  # PNG
-                if original_ext != '.png':
-                    new_name = base_name + ".png"
-                else:
-                    new_name = os.path.basename(input_path)  # Keep original extension
+            keep_extensions = _KEEP_EXTENSIONS[ext]
+            
+            def generate(input_path: str) -> str:
+                base_name, original_ext = _split_filename(input_path)
+                if original_ext.lower() in keep_extensions:
+                    return base_name + original_ext
+                return base_name + ext
         else:
             # Use prefix/suffix approach
-            new_name = f"{prefix}{base_name}{suffix}"
-            
-            # Add appropriate extension
-            if output_format.upper() == "JPEG":
-                new_name += ".jpg"
-            else:  # PNG
-                new_name += ".png"
+            def generate(input_path: str) -> str:
+                return f"{prefix}{_split_filename(input_path)[0]}{suffix}{ext}"
         
-        return new_name
+        return generate
+    
+    def generate_output_filename(self, input_path: str, prefix: str = "", 
+                                suffix: str = "", output_format: str = "JPEG", 
+                                preserve_original: bool = False) -> str:
+        """Generate output filename based on naming rules"""
+        return self.output_filename_generator(prefix, suffix, output_format, preserve_original)(input_path)
     
     def check_file_conflicts(self, output_dir: str, input_files: List[str], 
                            prefix: str = "", suffix: str = "", 
@@ -252,49 +640,182 @@ class FileManager:
         """Check for potential file conflicts in output directory"""
         conflicts = []
         
+        # List the output directory once instead of calling exists() per file
+        try:
+            with os.scandir(output_dir) as entries:
+                existing = {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            return conflicts
+        
+        generate = self.output_filename_generator(prefix, suffix, output_format, preserve_original)
         for input_file in input_files:
-            output_filename = self.generate_output_filename(
-                input_file, prefix, suffix, output_format, preserve_original
-            )
-            output_path = os.path.join(output_dir, output_filename)
+            output_filename = generate(input_file)
             
-            if os.path.exists(output_path):
-                conflicts.append(output_path)
+            if os.path.normcase(output_filename) in existing:
+                conflicts.append(os.path.join(output_dir, output_filename))
         
         return conflicts
     
-    def get_file_size_formatted(self, file_path: str) -> str:
-        """Get formatted file size string"""
+    def get_file_size_formatted(self, file_path: str, size: Optional[int] = None) -> str:
+        """Get formatted file size string, using size when the caller already knows it"""
         try:
-            size = os.path.getsize(file_path)
-            for unit in ['B', 'KB', 'MB', 'GB']:
-                if size < 1024.0:
-                    return f"{size:.1f} {unit}"
-                size /= 1024.0
-            return f"{size:.1f} TB"
-        except:
+            if size is None:
+                size = self._file_stat(file_path).st_size
+            # Each unit is 2**10 times the previous one, so the bit length picks it directly
+            unit = min(max(size.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+            return f"{size / (1 << (unit * 10)):.1f} {_SIZE_UNITS[unit]}"
+        except OSError:
             return "Unknown"
     
-    def create_thumbnail(self, image_path: str, thumbnail_size: Tuple[int, int] = (150, 150)) -> Optional[Image.Image]:
-        """Create a thumbnail image for preview"""
+    def create_thumbnail(self, image_path: str, thumbnail_size: Tuple[int, int] = (150, 150)) -> Optional['Image.Image']:
+        """Create a thumbnail image for preview, reusing the on-disk thumbnail cache"""
+        try:
+            from PIL import Image
+            
+            st = os.stat(image_path)
+            cache_path = _thumb_cache_path(image_path, st, thumbnail_size)
+        except Exception as e:
+            print(f"Error creating thumbnail for {image_path}: {e}")
+            return None
+        
+        try:
+            with Image.open(cache_path) as cached:
+                cached.load()
+                # The source's header travels in the JPEG comment, so get_image_info
+                # need not reopen the source after a cache hit
+                header = _parse_thumb_comment(cached.info.get('comment'))
+                if header is not None:
+                    self._cache_header(image_path, st, *header)
+                return cached
+        except Exception:
+            # Missing or unreadable cache entry; render it again
+            pass
+        
+        thumbnail = self._render_thumbnail(image_path, thumbnail_size)
+        if thumbnail is not None:
+            cached_info = self._info_cache.get(self._path_key(image_path))
+            header = None
+            if cached_info is not None and cached_info[:2] == (st.st_mtime_ns, st.st_size):
+                header = cached_info[2]
+            self._store_thumbnail(thumbnail, cache_path, header)
+        return thumbnail
+    
+    @staticmethod
+    def _store_thumbnail(thumbnail: 'Image.Image', cache_path: str, header: Optional[Dict] = None):
+        """Write a thumbnail to the disk cache; a failed write only costs a later re-render"""
+        global _thumb_writes
+        # Write under a unique name and rename, so concurrent workers never
+        # read a half-written file
+        tmp_path = f"{cache_path}.{os.getpid()}.{id(thumbnail)}.tmp"
+        options = {}
+        if header is not None:
+            width, height = header['size']
+            options['comment'] = f"{width}x{height} {header['mode']} {header['format'] or ''}"
+        try:
+            os.makedirs(_THUMB_CACHE_DIR, exist_ok=True)
+            thumbnail.save(tmp_path, 'JPEG', quality=_THUMB_CACHE_QUALITY, **options)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            log.debug("Could not cache thumbnail %s: %s", cache_path, e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        
+        with _thumb_writes_lock:
+            prune = _thumb_writes % _THUMB_PRUNE_INTERVAL == 0
+            _thumb_writes += 1
+        if prune:
+            _prune_thumb_cache()
+    
+    def _render_thumbnail(self, image_path: str, thumbnail_size: Tuple[int, int]) -> Optional['Image.Image']:
+        """Decode and shrink an image into an RGB thumbnail"""
+        # libvips shrinks during decode, so prefer it when it is installed
+        vips = _load_pyvips()
+        if vips is not None:
+            try:
+                return self._vips_thumbnail(vips, image_path, thumbnail_size)
+            except Exception as e:
+                log.debug("libvips could not thumbnail %s, using PIL: %s", image_path, e)
+        
         try:
+            from PIL import Image
+            
             with Image.open(image_path) as img:
-                # Convert to RGB if necessary for thumbnail
-                if img.mode == 'RGBA':
-                    # Create white background for RGBA images
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    background.paste(img, mask=img.split()[3])
-                    img = background
-                elif img.mode != 'RGB':
+                # Record the header while the file is open so get_image_info need not reopen it
+                self._remember_header(image_path, img)
+                
+                # Let libjpeg decode straight at a reduced scale close to the target size
+                if img.format == 'JPEG':
+                    img.draft('RGB', thumbnail_size)
+                
+                # Beyond an 8x reduction LANCZOS is indistinguishable at thumbnail size
+                ratio = max(img.width / thumbnail_size[0], img.height / thumbnail_size[1])
+                resample = Image.Resampling.BILINEAR if ratio > 8 else Image.Resampling.LANCZOS
+                
+                # Convert other modes to RGB before resizing (palette images only resize with NEAREST)
+                if img.mode not in ('RGB', 'RGBA'):
                     img = img.convert('RGB')
                 
-                # Create thumbnail maintaining aspect ratio
-                img.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
+                # Create thumbnail maintaining aspect ratio; thumbnail() box-reduces large
+                # images before the final filter and resamples RGBA with premultiplied alpha
+                img.thumbnail(thumbnail_size, resample)
+                
+                if img.mode == 'RGBA':
+                    # Flatten onto a white background at thumbnail size rather than full size
+                    background = Image.new('RGB', img.size, (255, 255, 255))
+                    background.paste(img, mask=img.getchannel('A'))
+                    return background
                 return img.copy()
         except Exception as e:
             print(f"Error creating thumbnail for {image_path}: {e}")
             return None
     
+    @staticmethod
+    def _vips_thumbnail(vips, image_path: str, thumbnail_size: Tuple[int, int]) -> 'Image.Image':
+        """Create a thumbnail with libvips and hand it over as an RGB PIL image"""
+        from PIL import Image
+        
+        img = vips.Image.thumbnail(image_path, thumbnail_size[0], height=thumbnail_size[1], size='down')
+        img = img.colourspace('srgb')
+        if img.hasalpha():
+            img = img.flatten(background=[255, 255, 255])
+        img = img.cast('uchar')
+        return Image.frombytes('RGB', (img.width, img.height), img.write_to_memory())
+    
+    @staticmethod
+    def prefetch_files(file_paths: Iterable[str]):
+        """Ask the kernel to start reading files into the page cache ahead of decoding"""
+        # Only POSIX systems offer posix_fadvise; elsewhere files are read on demand
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        for file_path in file_paths:
+            try:
+                fd = os.open(file_path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+    
+    @staticmethod
+    def _free_backup_name(file_path: str, taken) -> str:
+        """Pick a backup file name not in the set of normcased names already taken"""
+        name, ext = _split_filename(file_path)
+        filename = name + ext
+        counter = 1
+        while os.path.normcase(filename) in taken:
+            # After many backups of the same file stop counting and add a timestamp
+            if counter > _MAX_BACKUP_COUNTER:
+                return f"{name}_{time.time_ns()}{ext}"
+            filename = f"{name}_{counter}{ext}"
+            counter += 1
+        return filename
+    
     def backup_file(self, file_path: str, backup_dir: Optional[str] = None) -> Optional[str]:
         """Create a backup of a file before processing"""
         try:
@@ -303,22 +824,61 @@ class FileManager:
             
             os.makedirs(backup_dir, exist_ok=True)
             
-            filename = os.path.basename(file_path)
-            backup_path = os.path.join(backup_dir, filename)
+            # List the backup directory once and pick a free name in memory
+            with os.scandir(backup_dir) as entries:
+                taken = {os.path.normcase(entry.name) for entry in entries}
+            backup_path = os.path.join(backup_dir, self._free_backup_name(file_path, taken))
             
-            # Add timestamp if file exists
-            counter = 1
-            base_backup_path = backup_path
-            while os.path.exists(backup_path):
-                name, ext = os.path.splitext(base_backup_path)
-                backup_path = f"{name}_{counter}{ext}"
-                counter += 1
-            
-            shutil.copy2(file_path, backup_path)
+            _copy_file(file_path, backup_path)
             return backup_path
         except Exception as e:
             print(f"Error creating backup for {file_path}: {e}")
             return None
+    
+    def backup_files(self, file_paths: List[str], backup_dir: Optional[str] = None) -> List[Optional[str]]:
+        """Back up many files, copying in parallel; returns the backup path (or None) per file"""
+        if not file_paths:
+            return []
+        
+        taken_names = {}  # backup directory -> normcased names already used in it
+        targets = []
+        
+        # Create each backup directory and list its contents only once
+        for file_path in file_paths:
+            target_dir = backup_dir or os.path.join(os.path.dirname(file_path), "backup")
+            if target_dir not in taken_names:
+                try:
+                    os.makedirs(target_dir, exist_ok=True)
+                    with os.scandir(target_dir) as entries:
+                        taken_names[target_dir] = {os.path.normcase(entry.name) for entry in entries}
+                except OSError as e:
+                    print(f"Error creating backup directory {target_dir}: {e}")
+                    taken_names[target_dir] = None
+            
+            taken = taken_names[target_dir]
+            if taken is None:
+                targets.append(None)
+                continue
+            
+            # Pick a free name against the in-memory listing instead of probing the disk
+            filename = self._free_backup_name(file_path, taken)
+            taken.add(os.path.normcase(filename))
+            targets.append(os.path.join(target_dir, filename))
+        
+        def copy_one(file_path, backup_path):
+            if backup_path is None:
+                return None
+            try:
+                _copy_file(file_path, backup_path)
+                return backup_path
+            except Exception as e:
+                print(f"Error creating backup for {file_path}: {e}")
+                return None
+        
+        # Copies are I/O bound and release the GIL
+        workers = min(32, (os.cpu_count() or 1) * 4, len(file_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(copy_one, file_paths, targets))
 
 class DragDropHandler:
     """Handles drag and drop functionality for file import with robust Windows support"""
@@ -347,6 +907,7 @@ class DragDropHandler:
     
     def try_tkdnd(self):
         """Try to use tkdnd library if available"""
+        import tkinter as tk
         try:
             # Check if tkdnd is available
             self.widget.tk.call('package', 'require', 'tkdnd')
@@ -369,10 +930,13 @@ class DragDropHandler:
     
     def try_windows_native(self):
         """Try Windows-specific drag-drop using windnd"""
+        # windnd is an optional dependency; never try to install it at runtime
+        windnd = _load_windnd()
+        if windnd is None:
+            print("Windows native drag-drop not available (windnd not installed)")
+            return False
+        
         try:
-            # Try importing windnd (Windows-specific drag-drop)
-            import windnd
-            
             # Hook the widget for file drops
             windnd.hook_dropfiles(self.widget, func=self.on_windows_drop)
             
@@ -380,17 +944,13 @@ class DragDropHandler:
             print("✓ Windows native drag-drop enabled")
             return True
             
-        except ImportError:
-            # Do not attempt to install windnd dynamically in executable
-            # This can cause infinite loops and process spawning
-            print("Windows native drag-drop not available (windnd not installed)")
-            return False
         except Exception as e:
             print(f"Windows native drag-drop setup failed: {e}")
             return False
     
     def setup_enhanced_fallback(self):
         """Setup enhanced fallback with better visual feedback"""
+        import tkinter as tk
         print("Setting up enhanced click-to-import fallback")
         
         # Configure the widget as a drop zone
@@ -417,9 +977,14 @@ class DragDropHandler:
     
     def on_tkdnd_drop(self, event):
         """Handle drop event from tkdnd"""
+        import tkinter as tk
         try:
             # Get dropped files
-            files = self.widget.tk.splitlist(event.data)
+            try:
+                files = self.widget.tk.splitlist(event.data)
+            except tk.TclError:
+                # Malformed list (e.g. unbalanced braces): pick out the tokens ourselves
+                files = [next(g for g in m.groups() if g is not None) for m in _DND_TOKEN.finditer(event.data)]
             self._process_dropped_files(files)
         except Exception as e:
             print(f"Error processing tkdnd drop: {e}")
@@ -427,7 +992,7 @@ class DragDropHandler:
     def on_windows_drop(self, files):
         """Handle drop event from Windows native"""
         try:
-            print(f"Windows drop received: {files} (type: {type(files)})")
+            log.debug("Windows drop received: %r (type: %s)", files, type(files))
             if isinstance(files, (list, tuple)):
                 self._process_dropped_files(files)
             elif isinstance(files, str):
@@ -470,33 +1035,50 @@ class DragDropHandler:
     def _process_dropped_files(self, files):
         """Process the list of dropped files"""
         try:
-            print(f"Processing {len(files)} dropped files: {files}")
+            log.debug("Processing %d dropped files: %r", len(files), files)
             imported_files = []
             imported_folders = []
             
+            # Bind per-path lookups once for the loop
+            file_manager = self.file_manager
+            import_single_file = file_manager.import_single_file
+            add_imported = imported_files.append
+            stat_path = os.stat
+            S_ISREG = stat.S_ISREG
+            S_ISDIR = stat.S_ISDIR
+            
             for file_path in files:
                 # Clean the file path - handle bytes from windnd
                 if isinstance(file_path, bytes):
-                    file_path = file_path.decode('utf-8')
-                file_path = str(file_path).strip('"\'{}')
-                print(f"Processing file: {file_path}")
+                    file_path = os.fsdecode(file_path)
+                elif not isinstance(file_path, str):
+                    file_path = str(file_path)
+                # Only strip when the path is actually wrapped in quotes or braces
+                if file_path[:1] in _PATH_WRAPPERS or file_path[-1:] in _PATH_WRAPPERS:
+                    file_path = file_path.strip(_PATH_WRAPPERS)
+                log.debug("Processing file: %s", file_path)
+                
+                # One stat tells files and folders apart and is reused for the import
+                try:
+                    st = stat_path(file_path)
+                except OSError:
+                    log.debug("Path does not exist: %s", file_path)
+                    continue
                 
-                if os.path.isfile(file_path):
-                    print(f"File exists: {file_path}")
-                    if self.file_manager.is_image_file(file_path):
-                        print(f"Valid image file: {file_path}")
-                        if self.file_manager.import_single_file(file_path):
-                            imported_files.append(file_path)
-                            print(f"Successfully imported: {file_path}")
+                if S_ISREG(st.st_mode):
+                    log.debug("File exists: %s", file_path)
+                    # Dropped files may come without an extension, so import_single_file
+                    # checks their content too; it opens such a file only once
+                    if import_single_file(file_path, st, sniff=True):
+                        add_imported(file_path)
+                        log.debug("Successfully imported: %s", file_path)
                     else:
-                        print(f"Not an image file: {file_path}")
-                elif os.path.isdir(file_path):
-                    print(f"Processing directory: {file_path}")
-                    folder_files = self.file_manager.import_folder(file_path, recursive=False)
-                    imported_folders.extend(folder_files)
-                    print(f"Imported {len(folder_files)} files from folder")
-                else:
-                    print(f"Path does not exist: {file_path}")
+                        log.debug("Not an image file or already imported: %s", file_path)
+                elif S_ISDIR(st.st_mode):
+                    log.debug("Processing directory: %s", file_path)
+                    folder_count = len(imported_folders)
+                    imported_folders.extend(file_manager.iter_import_folder(file_path, recursive=False))
+                    log.debug("Imported %d files from folder", len(imported_folders) - folder_count)
             
             # Call callback if provided
             all_imported = imported_files + imported_folders
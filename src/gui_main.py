@@ -7,20 +7,112 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, colorchooser, simpledialog
 import os
 import sys
+import copy
+import queue
+import threading
+import difflib
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
 from PIL import Image, ImageTk
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
-# Add src directory to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__)))
+# Make sibling modules importable when this module is loaded as src.gui_main;
+# main.py and direct runs already have the directory on the path
+_src_dir = os.path.dirname(os.path.abspath(__file__))
+if _src_dir not in sys.path:
+    sys.path.append(_src_dir)
 
 from image_processor import ImageProcessor, WatermarkConfig, WatermarkPosition, WatermarkType
 from file_manager import FileManager, DragDropHandler
 from template_manager import TemplateManager
-import tkinter.simpledialog
+
+# Number of downscaled images and rendered previews kept for quick re-display
+PREVIEW_CACHE_SIZE = 8
+
+# Enum members by value, so GUI strings map back without going through Enum.__call__
+POSITION_BY_VALUE = {position.value: position for position in WatermarkPosition}
+TYPE_BY_VALUE = {watermark_type.value: watermark_type for watermark_type in WatermarkType}
+CUSTOM_POSITION_VALUE = WatermarkPosition.CUSTOM.value
+
+@lru_cache(maxsize=256)
+def rgb_to_hex(rgb_tuple):
+    """Convert RGB tuple to hex string"""
+    r, g, b = rgb_tuple[:3]
+    return f"#{r << 16 | g << 8 | b:06x}"
+
+@lru_cache(maxsize=256)
+def hex_to_rgb(hex_string):
+    """Convert hex string to RGB tuple"""
+    value = int(hex_string.lstrip('#'), 16)
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+
+@lru_cache(maxsize=4096)
+def format_filename_for_display(filename, max_length=30):
+    """Format filename for display, showing beginning and end for long names"""
+    if len(filename) <= max_length:
+        return filename
+    
+    # For very long filenames, show start and end with "..." in middle
+    half_length = (max_length - 3) // 2
+    start = filename[:half_length]
+    end = filename[-half_length:] if len(filename) > half_length else filename
+    return f"{start}...{end}"
+
+# Tk variables mirroring WatermarkConfig: (attribute suffix, variable class, config getter)
+VAR_SPEC = [
+    # Text watermark
+    ("watermark_text", tk.StringVar, lambda c: c.text),
+    ("font_family", tk.StringVar, lambda c: c.font_family),
+    ("font_size", tk.IntVar, lambda c: c.font_size),
+    ("font_bold", tk.BooleanVar, lambda c: c.font_bold),
+    ("font_italic", tk.BooleanVar, lambda c: c.font_italic),
+    ("text_color", tk.StringVar, lambda c: rgb_to_hex(c.text_color)),
+    ("opacity", tk.IntVar, lambda c: c.opacity),
+    ("rotation", tk.IntVar, lambda c: c.rotation),
+    # Position
+    ("position", tk.StringVar, lambda c: c.position.value),
+    ("margin_x", tk.IntVar, lambda c: c.margin_x),
+    ("margin_y", tk.IntVar, lambda c: c.margin_y),
+    # Watermark type
+    ("watermark_type", tk.StringVar, lambda c: c.watermark_type.value),
+    # Image watermark
+    ("watermark_image_path", tk.StringVar, lambda c: c.watermark_image_path),
+    ("scale_factor", tk.DoubleVar, lambda c: c.scale_factor),
+    # Advanced features
+    ("stroke_width", tk.IntVar, lambda c: c.stroke_width),
+    ("stroke_color", tk.StringVar, lambda c: rgb_to_hex(c.stroke_color)),
+    ("shadow_offset_x", tk.IntVar, lambda c: c.shadow_offset[0]),
+    ("shadow_offset_y", tk.IntVar, lambda c: c.shadow_offset[1]),
+    ("shadow_color", tk.StringVar, lambda c: rgb_to_hex(c.shadow_color)),
+]
 
 class WatermarkApp:
     """Main application class for the Photo Watermark tool"""
     
+    # Variables created from VAR_SPEC in setup_gui_variables
+    var_watermark_text: tk.StringVar
+    var_font_family: tk.StringVar
+    var_font_size: tk.IntVar
+    var_font_bold: tk.BooleanVar
+    var_font_italic: tk.BooleanVar
+    var_text_color: tk.StringVar
+    var_opacity: tk.IntVar
+    var_rotation: tk.IntVar
+    var_position: tk.StringVar
+    var_margin_x: tk.IntVar
+    var_margin_y: tk.IntVar
+    var_watermark_type: tk.StringVar
+    var_watermark_image_path: tk.StringVar
+    var_scale_factor: tk.DoubleVar
+    var_stroke_width: tk.IntVar
+    var_stroke_color: tk.StringVar
+    var_shadow_offset_x: tk.IntVar
+    var_shadow_offset_y: tk.IntVar
+    var_shadow_color: tk.StringVar
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Photo Watermark Application")
@@ -34,9 +126,51 @@ class WatermarkApp:
         
         # Current state
         self.current_config = WatermarkConfig()
+        # Set by traces on the watermark variables; current_config is only re-read when set
+        self._config_dirty = True
         self.current_image_index = 0
         self.preview_image = None
         self.original_image = None
+        self._render_pending_id = None
+        self._fast_mode = False
+        self._preview_path = None
+        self._preview_scale = 1.0
+        self._wm_photo = None
+        self.preview_photo: Optional[ImageTk.PhotoImage] = None
+        self._preview_id = None
+        self._preview_size = None
+        # Only the current full-size original is kept; other images are
+        # remembered as their downscaled preview bases
+        self._original_path = None
+        self._base_cache = OrderedDict()
+        self._composite_cache = OrderedDict()
+        
+        # Preview composites are rendered by a worker thread; a new request
+        # replaces one still waiting, and results come back through a one-slot queue
+        self._render_cond = threading.Condition()
+        self._render_job: Optional[Tuple[tuple, Image.Image, Optional[Image.Image],
+                                         WatermarkConfig, bool]] = None
+        self._render_out = queue.Queue(maxsize=1)
+        self._render_key = None
+        self._render_posted_key = None
+        self._render_drain_id = None
+        threading.Thread(target=self._render_worker, daemon=True).start()
+        
+        # Thumbnails are decoded by workers and attached on the Tk thread
+        self._thumb_pool = ThreadPoolExecutor(max_workers=4)
+        self._thumb_queue = queue.Queue()
+        self._thumb_pending = 0
+        self._thumb_drain_id = None
+        self._thumb_paths = []
+        self._thumb_labels = []
+        self._thumb_refs = {}
+        self._selected_thumb = None
+        self._template_names_shown = []
+        
+        # Batch exports run in worker processes, created on first use
+        self._export_pool = None
+        self._export_futures = []
+        self._export_output_dir = None
         
         # GUI variables
         self.setup_gui_variables()
@@ -60,27 +194,11 @@ class WatermarkApp:
     
     def setup_gui_variables(self):
         """Initialize all GUI variables"""
-        # Text watermark variables
-        self.var_watermark_text = tk.StringVar(value=self.current_config.text)
-        self.var_font_family = tk.StringVar(value=self.current_config.font_family)
-        self.var_font_size = tk.IntVar(value=self.current_config.font_size)
-        self.var_font_bold = tk.BooleanVar(value=self.current_config.font_bold)
-        self.var_font_italic = tk.BooleanVar(value=self.current_config.font_italic)
-        self.var_text_color = tk.StringVar(value=self.rgb_to_hex(self.current_config.text_color))
-        self.var_opacity = tk.IntVar(value=self.current_config.opacity)
-        self.var_rotation = tk.IntVar(value=self.current_config.rotation)
-        
-        # Position variables
-        self.var_position = tk.StringVar(value=self.current_config.position.value)
-        self.var_margin_x = tk.IntVar(value=self.current_config.margin_x)
-        self.var_margin_y = tk.IntVar(value=self.current_config.margin_y)
-        
-        # Watermark type
-        self.var_watermark_type = tk.StringVar(value=self.current_config.watermark_type.value)
-        
-        # Image watermark variables
-        self.var_watermark_image_path = tk.StringVar(value=self.current_config.watermark_image_path)
-        self.var_scale_factor = tk.DoubleVar(value=self.current_config.scale_factor)
+        # Watermark settings, created from the current configuration
+        for name, var_class, getter in VAR_SPEC:
+            var = var_class(self.root, value=getter(self.current_config), name=f"wm_{name}")
+            var.trace_add('write', self._mark_config_dirty)
+            setattr(self, f"var_{name}", var)
         
         # Export variables
         self.var_output_format = tk.StringVar(value="JPEG")
@@ -88,22 +206,6 @@ class WatermarkApp:
         self.var_filename_prefix = tk.StringVar(value="")
         self.var_filename_suffix = tk.StringVar(value="_watermarked")
         self.var_output_directory = tk.StringVar(value="")
-        
-        # Advanced features
-        self.var_stroke_width = tk.IntVar(value=self.current_config.stroke_width)
-        self.var_stroke_color = tk.StringVar(value=self.rgb_to_hex(self.current_config.stroke_color))
-        self.var_shadow_offset_x = tk.IntVar(value=self.current_config.shadow_offset[0])
-        self.var_shadow_offset_y = tk.IntVar(value=self.current_config.shadow_offset[1])
-        self.var_shadow_color = tk.StringVar(value=self.rgb_to_hex(self.current_config.shadow_color))
-    
-    def rgb_to_hex(self, rgb_tuple):
-        """Convert RGB tuple to hex string"""
-        return f"#{rgb_tuple[0]:02x}{rgb_tuple[1]:02x}{rgb_tuple[2]:02x}"
-    
-    def hex_to_rgb(self, hex_string):
-        """Convert hex string to RGB tuple"""
-        hex_string = hex_string.lstrip('#')
-        return tuple(int(hex_string[i:i+2], 16) for i in (0, 2, 4))
     
     def create_widgets(self):
         """Create all GUI widgets"""
@@ -132,26 +234,33 @@ class WatermarkApp:
         # Create notebook for organized tabs
         self.control_notebook = ttk.Notebook(self.left_panel)
         
-        # File Operations Tab
-        self.create_file_tab()
-        
-        # Watermark Settings Tab
-        self.create_watermark_tab()
-        
-        # Position & Style Tab
-        self.create_position_tab()
-        
-        # Export Settings Tab
-        self.create_export_tab()
-        
-        # Template Management Tab
-        self.create_template_tab()
-    
-    def create_file_tab(self):
+        # Add every tab up front but only fill in the Files tab; the others are
+        # built the first time they are selected
+        self._tab_builders = {}
+        tabs = [
+            ("Files", self.create_file_tab),
+            ("Watermark", self.create_watermark_tab),
+            ("Position & Style", self.create_position_tab),
+            ("Export", self.create_export_tab),
+            ("Templates", self.create_template_tab)
+        ]
+        for title, builder in tabs:
+            frame = ttk.Frame(self.control_notebook)
+            self.control_notebook.add(frame, text=title)
+            self._tab_builders[str(frame)] = (builder, frame)
+        self.build_tab(str(self.control_notebook.tabs()[0]))
+        self.control_notebook.bind('<<NotebookTabChanged>>',
+                                   lambda e: self.build_tab(self.control_notebook.select()))
+    
+    def build_tab(self, tab_id):
+        """Build a notebook tab's widgets if that has not happened yet"""
+        entry = self._tab_builders.pop(str(tab_id), None)
+        if entry:
+            builder, frame = entry
+            builder(frame)
+    
+    def create_file_tab(self, file_frame):
         """Create file operations tab"""
-        file_frame = ttk.Frame(self.control_notebook)
-        self.control_notebook.add(file_frame, text="Files")
-        
         # Import section
         import_frame = ttk.LabelFrame(file_frame, text="Import Images", padding=10)
         import_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -176,11 +285,8 @@ class WatermarkApp:
         self.file_count_label = ttk.Label(import_frame, text="Files imported: 0")
         self.file_count_label.pack(pady=2)
     
-    def create_watermark_tab(self):
+    def create_watermark_tab(self, watermark_frame):
         """Create watermark settings tab"""
-        watermark_frame = ttk.Frame(self.control_notebook)
-        self.control_notebook.add(watermark_frame, text="Watermark")
-        
         # Watermark type selection
         type_frame = ttk.LabelFrame(watermark_frame, text="Watermark Type", padding=5)
         type_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -257,14 +363,11 @@ class WatermarkApp:
         scale_spin.pack(side=tk.RIGHT)
         scale_spin.bind('<KeyRelease>', self.on_scale_change)
         
-        # Initially hide image frame
-        self.image_frame.pack_forget()
+        # Show the settings for the current watermark type
+        self.layout_watermark_type()
     
-    def create_position_tab(self):
+    def create_position_tab(self, position_frame):
         """Create position and style settings tab"""
-        position_frame = ttk.Frame(self.control_notebook)
-        self.control_notebook.add(position_frame, text="Position & Style")
-        
         # Position settings
         pos_frame = ttk.LabelFrame(position_frame, text="Position", padding=5)
         pos_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -282,7 +385,7 @@ class WatermarkApp:
         for i, (symbol, pos) in enumerate(positions):
             row, col = divmod(i, 3)
             btn = ttk.Button(grid_frame, text=symbol, width=3,
-                           command=lambda p=pos: self.set_position(p))
+                           command=partial(self.set_position, pos))
             btn.grid(row=row, column=col, padx=1, pady=1)
         
         # Margin settings
@@ -317,17 +420,23 @@ class WatermarkApp:
         opacity_frame = ttk.Frame(style_frame)
         opacity_frame.pack(fill=tk.X, pady=2)
         ttk.Label(opacity_frame, text="Opacity:").pack(side=tk.LEFT)
+        opacity_value = ttk.Label(opacity_frame, width=4, anchor=tk.E)
+        opacity_value.pack(side=tk.RIGHT)
         self.opacity_scale = ttk.Scale(opacity_frame, from_=0, to=100, orient=tk.HORIZONTAL,
-                                      variable=self.var_opacity, command=self.on_opacity_change)
+                                      variable=self.var_opacity)
         self.opacity_scale.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(10, 0))
+        self.bind_scale(self.opacity_scale, self.var_opacity, opacity_value, self.on_opacity_change)
         
         # Rotation
         rotation_frame = ttk.Frame(style_frame)
         rotation_frame.pack(fill=tk.X, pady=2)
         ttk.Label(rotation_frame, text="Rotation:").pack(side=tk.LEFT)
+        rotation_value = ttk.Label(rotation_frame, width=4, anchor=tk.E)
+        rotation_value.pack(side=tk.RIGHT)
         self.rotation_scale = ttk.Scale(rotation_frame, from_=-180, to=180, orient=tk.HORIZONTAL,
-                                       variable=self.var_rotation, command=self.on_rotation_change)
+                                       variable=self.var_rotation)
         self.rotation_scale.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=(10, 0))
+        self.bind_scale(self.rotation_scale, self.var_rotation, rotation_value, self.on_rotation_change)
         
         # Advanced text effects
         self.advanced_frame = ttk.LabelFrame(position_frame, text="Advanced Effects", padding=5)
@@ -350,12 +459,22 @@ class WatermarkApp:
                                             bg=self.var_stroke_color.get(),
                                             command=self.choose_stroke_color)
         self.stroke_color_button.pack(side=tk.RIGHT)
+        
+        # Advanced effects only apply to text watermarks
+        self.layout_watermark_type()
     
-    def create_export_tab(self):
-        """Create export settings tab"""
-        export_frame = ttk.Frame(self.control_notebook)
-        self.control_notebook.add(export_frame, text="Export")
+    def bind_scale(self, scale, variable, value_label, on_change):
+        """Show a scale's value live but only re-render the preview once it is let go"""
+        def show_value(*args):
+            value_label.configure(text=str(variable.get()))
         
+        show_value()
+        variable.trace_add('write', show_value)
+        scale.bind('<ButtonRelease-1>', on_change)
+        scale.bind('<KeyRelease>', on_change)
+    
+    def create_export_tab(self, export_frame):
+        """Create export settings tab"""
         # Output directory
         dir_frame = ttk.LabelFrame(export_frame, text="Output Directory", padding=5)
         dir_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -368,6 +487,7 @@ class WatermarkApp:
         self.output_dir_label = ttk.Label(dir_frame, text="No directory selected",
                                          foreground='gray')
         self.output_dir_label.pack(fill=tk.X, pady=2)
+        self.update_output_dir_label()
         
         # Format settings
         format_frame = ttk.LabelFrame(export_frame, text="Format Settings", padding=5)
@@ -403,14 +523,13 @@ class WatermarkApp:
         
         ttk.Button(export_btn_frame, text="Export Current Image",
                   command=self.export_current_image).pack(fill=tk.X, pady=2)
-        ttk.Button(export_btn_frame, text="Export All Images",
-                  command=self.export_all_images).pack(fill=tk.X, pady=2)
+        self.export_all_button = ttk.Button(export_btn_frame, text="Export All Images",
+                                            command=self.export_all_images)
+        self.export_all_button.pack(fill=tk.X, pady=2)
+        self.update_export_button()
     
-    def create_template_tab(self):
+    def create_template_tab(self, template_frame):
         """Create template management tab"""
-        template_frame = ttk.Frame(self.control_notebook)
-        self.control_notebook.add(template_frame, text="Templates")
-        
         # Template management
         mgmt_frame = ttk.LabelFrame(template_frame, text="Template Management", padding=5)
         mgmt_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -535,69 +654,51 @@ class WatermarkApp:
         
         # Variable traces for real-time updates
         self.var_watermark_text.trace('w', self.on_config_change)
-        self.var_opacity.trace('w', self.on_config_change)
-        self.var_rotation.trace('w', self.on_config_change)
     
     def setup_tooltips(self):
         """Setup tooltip functionality"""
+        # Tooltip text by widget path; one class binding serves every widget with a tooltip
         self.tooltips = {}
+        self.root.bind_class('WMTooltip', '<Enter>', self.on_tooltip_enter)
+        self.root.bind_class('WMTooltip', '<Leave>', lambda e: self.hide_tooltip())
+        self.root.bind_class('WMTooltip', '<Destroy>', lambda e: self.tooltips.pop(str(e.widget), None))
+        
+        # One hidden tooltip window is reused for every widget
+        self._tooltip_window = tk.Toplevel(self.root)
+        self._tooltip_window.wm_overrideredirect(True)
+        self._tooltip_window.configure(bg='yellow')
+        self._tooltip_window.withdraw()
+        self._tooltip_label = tk.Label(
+            self._tooltip_window,
+            bg='yellow',
+            fg='black',
+            font=('Arial', 8),
+            padx=5,
+            pady=2
+        )
+        self._tooltip_label.pack()
     
     def add_tooltip(self, widget, text):
         """Add tooltip to a widget"""
-        def on_enter(event):
-            self.show_tooltip(widget, text)
-        
-        def on_leave(event):
-            self.hide_tooltip()
-        
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
+        self.tooltips[str(widget)] = text
+        widget.bindtags(widget.bindtags() + ('WMTooltip',))
     
-    def format_filename_for_display(self, filename, max_length=30):
-        """Format filename for display, showing beginning and end for long names"""
-        if len(filename) <= max_length:
-            return filename
-        
-        # For very long filenames, show start and end with "..." in middle
-        half_length = (max_length - 3) // 2
-        start = filename[:half_length]
-        end = filename[-half_length:] if len(filename) > half_length else filename
-        return f"{start}...{end}"
+    def on_tooltip_enter(self, event):
+        """Show the tooltip registered for the widget under the pointer"""
+        text = self.tooltips.get(str(event.widget))
+        if text is not None:
+            self.show_tooltip(event.widget, text)
     
     def show_tooltip(self, widget, text):
         """Show tooltip with full text"""
-        # Get widget position
-        x, y = widget.winfo_rootx(), widget.winfo_rooty()
-        
-        # Create tooltip window if it doesn't exist
-        if not hasattr(self, '_tooltip_window') or not self._tooltip_window:
-            self._tooltip_window = tk.Toplevel()
-            self._tooltip_window.wm_overrideredirect(True)
-            self._tooltip_window.configure(bg='yellow')
-            
-            self._tooltip_label = tk.Label(
-                self._tooltip_window,
-                text=text,
-                bg='yellow',
-                fg='black',
-                font=('Arial', 8),
-                padx=5,
-                pady=2
-            )
-            self._tooltip_label.pack()
-        else:
-            self._tooltip_label.configure(text=text)
-            self._tooltip_window.configure(bg='yellow')
-            self._tooltip_label.configure(bg='yellow', fg='black')
-        
+        self._tooltip_label.configure(text=text)
         # Position tooltip near the widget
-        self._tooltip_window.wm_geometry(f"+{x}+{y-30}")
+        self._tooltip_window.wm_geometry(f"+{widget.winfo_rootx()}+{widget.winfo_rooty() - 30}")
         self._tooltip_window.deiconify()
     
     def hide_tooltip(self):
         """Hide tooltip"""
-        if hasattr(self, '_tooltip_window') and self._tooltip_window:
-            self._tooltip_window.withdraw()
+        self._tooltip_window.withdraw()
     
     def setup_drag_drop(self):
         """Setup drag and drop functionality"""
@@ -626,6 +727,7 @@ class WatermarkApp:
     def on_files_dropped(self, file_paths):
         """Handle files dropped into the application"""
         if file_paths:
+            self.invalidate_preview_cache()
             self.update_file_list()
             self.update_file_count()
             # Select the first newly imported image
@@ -647,23 +749,58 @@ class WatermarkApp:
         """Handle mouse click on preview canvas"""
         if self.original_image:
             self.dragging_watermark = True
+            self._fast_mode = True
             self.drag_start_x = event.x
             self.drag_start_y = event.y
+            # Lift the watermark onto its own canvas item so dragging only moves it
+            self.update_config_from_gui()
+            self._show_watermark_layer()
             # Set position to custom and update coordinates
-            self.var_position.set(WatermarkPosition.CUSTOM.value)
+            self.var_position.set(CUSTOM_POSITION_VALUE)
             self.current_config.position = WatermarkPosition.CUSTOM
     
     def on_preview_drag(self, event):
         """Handle mouse drag on preview canvas"""
         if self.dragging_watermark and self.original_image:
-            # Calculate new position relative to image
-            self.current_config.custom_x = event.x
-            self.current_config.custom_y = event.y
-            self.update_preview()
+            # Calculate new position relative to the full-size image
+            x = self.preview_canvas.canvasx(event.x)
+            y = self.preview_canvas.canvasy(event.y)
+            self.current_config.custom_x = int(x / self._preview_scale)
+            self.current_config.custom_y = int(y / self._preview_scale)
+            if self._wm_photo is not None:
+                self.preview_canvas.coords('wm', x, y)
+            else:
+                self._schedule_preview()
+    
+    def _show_watermark_layer(self):
+        """Draw the preview as an unwatermarked base plus a movable watermark item"""
+        if self.original_image is None:
+            return
+        base = self._preview_base()
+        if base is None:
+            return
+        layer = self._preview_watermark(self.original_image.size, self.current_config,
+                                        self._preview_scale, self._fast_mode)
+        if layer is None:
+            self._wm_photo = None
+            return
+        watermark, (x, y) = layer
+        
+        self.show_preview_image(base)
+        self._wm_photo = ImageTk.PhotoImage(watermark)
+        self.preview_canvas.delete('wm')
+        self.preview_canvas.create_image(x, y, anchor=tk.NW, image=self._wm_photo, tags='wm')
     
     def on_preview_release(self, event):
         """Handle mouse release on preview canvas"""
+        was_dragging = self.dragging_watermark
         self.dragging_watermark = False
+        self._fast_mode = False
+        
+        # Replace the low-quality drag frames with one full-quality render
+        if was_dragging:
+            self.sync_config_from_gui()
+            self.update_preview()
     
     # File operations methods
     def load_last_template(self):
@@ -678,49 +815,34 @@ class WatermarkApp:
     
     def apply_config_to_gui(self, config):
         """Apply a configuration to all GUI controls"""
-        # Text watermark settings
-        self.var_watermark_text.set(config.text)
-        self.var_font_family.set(config.font_family)
-        self.var_font_size.set(config.font_size)
-        self.var_font_bold.set(config.font_bold)
-        self.var_font_italic.set(config.font_italic)
-        self.var_text_color.set(self.rgb_to_hex(config.text_color))
-        self.var_opacity.set(config.opacity)
-        self.var_rotation.set(config.rotation)
-        
-        # Position settings
-        self.var_position.set(config.position.value)
-        self.var_margin_x.set(config.margin_x)
-        self.var_margin_y.set(config.margin_y)
-        
-        # Watermark type
-        self.var_watermark_type.set(config.watermark_type.value)
-        
-        # Image watermark
-        self.var_watermark_image_path.set(config.watermark_image_path)
-        self.var_scale_factor.set(config.scale_factor)
-        
-        # Advanced settings
-        self.var_stroke_width.set(config.stroke_width)
-        self.var_stroke_color.set(self.rgb_to_hex(config.stroke_color))
-        self.var_shadow_offset_x.set(config.shadow_offset[0])
-        self.var_shadow_offset_y.set(config.shadow_offset[1])
-        self.var_shadow_color.set(self.rgb_to_hex(config.shadow_color))
+        for name, _, getter in VAR_SPEC:
+            getattr(self, f"var_{name}").set(getter(config))
         
         # Update UI elements
         self.update_color_buttons()
         self.on_watermark_type_change()
     
+    def _mark_config_dirty(self, *args):
+        """Note that a watermark variable changed since current_config was last updated"""
+        self._config_dirty = True
+    
+    def sync_config_from_gui(self):
+        """Update the current configuration if a watermark variable changed"""
+        if self._config_dirty:
+            self.update_config_from_gui()
+    
     def update_config_from_gui(self):
         """Update the current configuration from GUI values"""
+        self._config_dirty = False
+        
         # Update configuration object
-        self.current_config.watermark_type = WatermarkType(self.var_watermark_type.get())
-        self.current_config.position = WatermarkPosition(self.var_position.get())
+        self.current_config.watermark_type = TYPE_BY_VALUE[self.var_watermark_type.get()]
+        self.current_config.position = POSITION_BY_VALUE[self.var_position.get()]
         self.current_config.opacity = self.var_opacity.get()
         self.current_config.rotation = self.var_rotation.get()
         
         # Text settings
-        text_color_rgb = self.hex_to_rgb(self.var_text_color.get())
+        text_color_rgb = hex_to_rgb(self.var_text_color.get())
         self.current_config.text_color = (text_color_rgb[0], text_color_rgb[1], text_color_rgb[2])
         self.current_config.text = self.var_watermark_text.get()
         self.current_config.font_family = self.var_font_family.get()
@@ -737,8 +859,8 @@ class WatermarkApp:
         self.current_config.scale_factor = self.var_scale_factor.get()
         
         # Advanced settings
-        stroke_color_rgb = self.hex_to_rgb(self.var_stroke_color.get())
-        shadow_color_rgb = self.hex_to_rgb(self.var_shadow_color.get())
+        stroke_color_rgb = hex_to_rgb(self.var_stroke_color.get())
+        shadow_color_rgb = hex_to_rgb(self.var_shadow_color.get())
         self.current_config.stroke_width = self.var_stroke_width.get()
         self.current_config.stroke_color = (stroke_color_rgb[0], stroke_color_rgb[1], stroke_color_rgb[2])
         self.current_config.shadow_offset = (self.var_shadow_offset_x.get(), self.var_shadow_offset_y.get())
@@ -749,6 +871,7 @@ class WatermarkApp:
         file_paths = self.file_manager.select_files_dialog(self.root)
         if file_paths:
             imported = self.file_manager.import_multiple_files(file_paths)
+            self.invalidate_preview_cache()
             self.update_file_list()
             self.update_file_count()
             if imported:
@@ -760,6 +883,7 @@ class WatermarkApp:
         folder_path = self.file_manager.select_folder_dialog(self.root)
         if folder_path:
             imported = self.file_manager.import_folder(folder_path)
+            self.invalidate_preview_cache()
             self.update_file_list()
             self.update_file_count()
             if imported:
@@ -773,6 +897,7 @@ class WatermarkApp:
                                        "Are you sure you want to clear all imported files?")
             if result:
                 self.file_manager.clear_all_files()
+                self.invalidate_preview_cache()
                 self.update_file_list()
                 self.update_file_count()
                 self.clear_preview()
@@ -784,63 +909,135 @@ class WatermarkApp:
     
     def update_file_list(self):
         """Update the thumbnail list of images"""
-        # Clear existing thumbnails
-        for widget in self.thumbnail_frame.winfo_children():
-            widget.destroy()
+        # Diff against the tiles already shown and only add or remove the changed ones
+        new_paths = list(self.file_manager.imported_files)
+        matcher = difflib.SequenceMatcher(None, self._thumb_paths, new_paths, autojunk=False)
+        opcodes = matcher.get_opcodes()
+        
+        # Start reading the new files from disk before the workers get to them
+        self.file_manager.prefetch_files(path for tag, _, _, j1, j2 in opcodes if tag != 'equal'
+                                         for path in new_paths[j1:j2])
+        labels = []
+        inserted = []
+        for tag, i1, i2, j1, j2 in opcodes:
+            if tag == 'equal':
+                labels.extend(self._thumb_labels[i1:i2])
+                continue
+            for thumb_label in self._thumb_labels[i1:i2]:
+                if thumb_label is not None:
+                    self._thumb_refs.pop(thumb_label, None)
+                    thumb_label.master.destroy()
+            for file_path in new_paths[j1:j2]:
+                thumb_label = self.create_thumbnail_widget(file_path)
+                if thumb_label is not None:
+                    # Workers decode the thumbnail; the placeholder is filled in later
+                    self._thumb_pool.submit(self._make_thumb, thumb_label, file_path)
+                    self._thumb_pending += 1
+                    inserted.append(len(labels))
+                labels.append(thumb_label)
+        
+        # New tiles are packed at the end; move any that belong earlier into place
+        for k in inserted:
+            previous = next((l for l in reversed(labels[:k]) if l is not None), None)
+            if previous is not None:
+                labels[k].master.pack_configure(after=previous.master)
+            else:
+                following = next((l for l in labels[k + 1:] if l is not None), None)
+                if following is not None:
+                    labels[k].master.pack_configure(before=following.master)
         
-        # Create thumbnails for each image
-        for i, file_path in enumerate(self.file_manager.imported_files):
-            self.create_thumbnail_widget(file_path, i)
+        self._thumb_paths = new_paths
+        self._thumb_labels = labels
+        self._highlight_current_thumbnail()
+        if self._thumb_pending and self._thumb_drain_id is None:
+            self._thumb_drain_id = self.root.after(50, self._drain_thumb_queue)
         
         # Update canvas scroll region
         self.thumbnail_frame.update_idletasks()
         self.image_list_canvas.configure(scrollregion=self.image_list_canvas.bbox("all"))
     
-    def create_thumbnail_widget(self, file_path: str, index: int):
-        """Create a thumbnail widget for an image"""
+    def _highlight_current_thumbnail(self):
+        """Move the solid border from the previously highlighted tile to the current image's tile"""
+        index = self.current_image_index
+        current = self._thumb_labels[index] if 0 <= index < len(self._thumb_labels) else None
+        previous = self._selected_thumb
+        if previous is current:
+            return
+        # New tiles start raised, so only these two tiles can need a change
+        if previous is not None and previous.winfo_exists():
+            previous.master.configure(relief=tk.RAISED, borderwidth=1)
+        if current is not None:
+            current.master.configure(relief=tk.SOLID, borderwidth=2)
+        self._selected_thumb = current
+    
+    def _make_thumb(self, thumb_label, file_path: str):
+        """Create a thumbnail in a worker thread and queue it for the Tk thread"""
+        thumbnail = None
         try:
-            # Create thumbnail
             thumbnail = self.file_manager.create_thumbnail(file_path, (100, 100))
-            if thumbnail:
-                # Convert to PhotoImage
-                photo = ImageTk.PhotoImage(thumbnail)
-                
-                # Create frame for thumbnail
-                thumb_frame = ttk.Frame(self.thumbnail_frame, relief=tk.RAISED, borderwidth=1)
-                thumb_frame.pack(side=tk.LEFT, padx=2, pady=2)
-                
-                # Create label with image
-                thumb_label = tk.Label(thumb_frame, image=photo, cursor="hand2")
-                thumb_label.pack()
-                # Keep reference to prevent garbage collection
-                setattr(thumb_label, 'image_ref', photo)
-                
-                # Create filename label
-                filename = os.path.basename(file_path)
-                display_name = self.format_filename_for_display(filename, 30)
-                name_label = tk.Label(thumb_frame, text=display_name, font=("Arial", 8))
-                name_label.pack()
-                
-                # Add tooltip for full filename on hover
-                self.add_tooltip(thumb_label, filename)
-                self.add_tooltip(name_label, filename)
-                
-                # Bind click event
-                thumb_label.bind("<Button-1>", lambda e, idx=index: self.select_image(idx))
-                name_label.bind("<Button-1>", lambda e, idx=index: self.select_image(idx))
-                
-                # Highlight current image
-                if index == self.current_image_index:
-                    thumb_frame.configure(relief=tk.SOLID, borderwidth=2)
+        finally:
+            # Always report back, or the drain loop would wait for this tile forever
+            self._thumb_queue.put((thumb_label, thumbnail))
+    
+    def _drain_thumb_queue(self):
+        """Attach finished thumbnails; PhotoImage may only be created on the Tk thread"""
+        while True:
+            try:
+                thumb_label, thumbnail = self._thumb_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._thumb_pending -= 1
+            # The tile may have been removed while its thumbnail was being made
+            if thumbnail is None or not thumb_label.winfo_exists():
+                continue
+            photo = ImageTk.PhotoImage(thumbnail)
+            # Width and height of 0 let the label take the image's own size
+            thumb_label.configure(image=photo, text="", width=0, height=0)
+            # Keep reference to prevent garbage collection
+            self._thumb_refs[thumb_label] = photo
+        
+        if self._thumb_pending:
+            self._thumb_drain_id = self.root.after(50, self._drain_thumb_queue)
+        else:
+            self._thumb_drain_id = None
+            self.image_list_canvas.configure(scrollregion=self.image_list_canvas.bbox("all"))
+    
+    def create_thumbnail_widget(self, file_path: str):
+        """Create a thumbnail widget for an image, initially showing a placeholder"""
+        try:
+            # Create frame for thumbnail
+            thumb_frame = ttk.Frame(self.thumbnail_frame, relief=tk.RAISED, borderwidth=1)
+            thumb_frame.pack(side=tk.LEFT, padx=2, pady=2)
+            
+            # Create placeholder label, filled in once the thumbnail is ready
+            thumb_label = tk.Label(thumb_frame, text="Loading...", width=14, height=6,
+                                   cursor="hand2")
+            thumb_label.pack()
+            
+            # Create filename label
+            filename = os.path.basename(file_path)
+            display_name = format_filename_for_display(filename, 30)
+            name_label = tk.Label(thumb_frame, text=display_name, font=("Arial", 8))
+            name_label.pack()
+            
+            # Add tooltip for full filename on hover
+            self.add_tooltip(thumb_label, filename)
+            self.add_tooltip(name_label, filename)
+            
+            # Bind click event; tiles move when the list changes, so look the index up on click
+            select = lambda e, l=thumb_label: self.select_image(self._thumb_labels.index(l))
+            thumb_label.bind("<Button-1>", select)
+            name_label.bind("<Button-1>", select)
+            return thumb_label
         except Exception as e:
             print(f"Error creating thumbnail for {file_path}: {e}")
+            return None
     
     def select_image(self, index: int):
         """Select an image by index"""
         if 0 <= index < len(self.file_manager.imported_files):
             self.current_image_index = index
             self.load_current_image()
-            self.update_file_list()  # Refresh to update highlighting
     
     def load_current_image(self):
         """Load and display the current image with watermark"""
@@ -850,12 +1047,15 @@ class WatermarkApp:
         
         if self.current_image_index >= len(self.file_manager.imported_files):
             self.current_image_index = 0
+        self._highlight_current_thumbnail()
         
         try:
             file_path = self.file_manager.imported_files[self.current_image_index]
-            self.original_image = self.image_processor.load_image(file_path)
+            self._preview_path = file_path
+            self.original_image = self._load_base_image(file_path)
             
             if self.original_image:
+                self.sync_config_from_gui()
                 self.update_preview()
                 self.no_image_label.place_forget()
             else:
@@ -870,31 +1070,184 @@ class WatermarkApp:
             return
         
         try:
-            # Update configuration from GUI
-            self.update_config_from_gui()
-            
-            # Apply watermark
-            watermarked_image = self.image_processor.apply_watermark(
-                self.original_image, self.current_config
-            )
-            
-            # Scale image for preview if too large
-            display_image = self.scale_for_preview(watermarked_image)
-            
-            # Convert to PhotoImage
-            self.preview_photo = ImageTk.PhotoImage(display_image)
-            
-            # Update canvas
-            self.preview_canvas.delete("all")
-            self.preview_canvas.create_image(0, 0, anchor=tk.NW, image=self.preview_photo)
+            # Reuse the rendered preview when these settings were seen before
+            key = (self._preview_path, self.current_config.cache_key(), self._fast_mode)
+            self._render_key = key
+            display_image = self._cache_get(self._composite_cache, key)
+            if display_image is not None:
+                self.display_preview(display_image)
+                return
             
-            # Update scroll region
-            self.preview_canvas.configure(scrollregion=self.preview_canvas.bbox("all"))
+            # Otherwise hand a snapshot of the settings to the render worker
+            base = self._cache_get(self._base_cache, self._preview_path)
+            job = (key, self.original_image, base, copy.copy(self.current_config), self._fast_mode)
+            with self._render_cond:
+                self._render_job = job
+                self._render_cond.notify()
+            self._render_posted_key = key
+            if self._render_drain_id is None:
+                self._render_drain_id = self.root.after(30, self._drain_render_out)
             
         except Exception as e:
             print(f"Error updating preview: {e}")
     
-    def scale_for_preview(self, image: Image.Image, max_size: int = 800) -> Image.Image:
+    def _render_worker(self):
+        """Composite previews off the Tk thread, always taking the newest request"""
+        while True:
+            with self._render_cond:
+                self._render_cond.wait_for(lambda: self._render_job is not None)
+                job = self._render_job
+                self._render_job = None
+            if job is None:
+                continue
+            key, original_image, base, config, fast = job
+            
+            try:
+                if base is None:
+                    base = self.scale_for_preview(original_image)
+                # Composite at preview size: paste the scaled watermark onto the
+                # scaled image instead of watermarking and scaling the full image
+                display_image = base
+                layer = self._preview_watermark(original_image.size, config,
+                                                base.width / original_image.width, fast)
+                if layer is not None:
+                    watermark, position = layer
+                    display_image = base.copy()
+                    display_image.paste(watermark, position, watermark)
+                result = (key, base, display_image)
+            except Exception as e:
+                print(f"Error updating preview: {e}")
+                result = (key, None, None)
+            
+            # Only the newest result matters; drop one the Tk thread has not collected
+            try:
+                self._render_out.get_nowait()
+            except queue.Empty:
+                pass
+            self._render_out.put_nowait(result)
+    
+    def _drain_render_out(self):
+        """Show finished previews and keep polling until the newest request is done"""
+        try:
+            key, base, display_image = self._render_out.get_nowait()
+        except queue.Empty:
+            self._render_drain_id = self.root.after(30, self._drain_render_out)
+            return
+        
+        if display_image is not None:
+            self._cache_put(self._base_cache, key[0], base)
+            self._cache_put(self._composite_cache, key, display_image)
+            # Show it if it is what was asked for, or the best available while the
+            # newest render is still running; never replace the drag layer
+            wanted = key == self._render_key or self._render_key == self._render_posted_key
+            if (wanted and key[0] == self._preview_path and self.original_image
+                    and not self.dragging_watermark):
+                self.display_preview(display_image)
+        
+        if key == self._render_posted_key:
+            self._render_drain_id = None
+        else:
+            self._render_drain_id = self.root.after(30, self._drain_render_out)
+    
+    def display_preview(self, display_image: Image.Image):
+        """Show a finished preview, removing any drag layer"""
+        if self.original_image is None:
+            return
+        self._preview_scale = display_image.width / self.original_image.width
+        self.preview_canvas.delete('wm')
+        self._wm_photo = None
+        self.show_preview_image(display_image)
+    
+    def show_preview_image(self, image: Image.Image):
+        """Show an image on the preview canvas, reusing the canvas item"""
+        # Same size as the image on screen: write the pixels into the existing photo
+        if (self.preview_photo is not None and self._preview_id is not None
+                and image.size == self._preview_size):
+            self.preview_photo.paste(image)
+            return
+        
+        self.preview_photo = ImageTk.PhotoImage(image)
+        if self._preview_id is None:
+            self._preview_id = self.preview_canvas.create_image(0, 0, anchor=tk.NW,
+                                                                image=self.preview_photo)
+        else:
+            self.preview_canvas.itemconfigure(self._preview_id, image=self.preview_photo)
+        
+        # Update scroll region only when the preview size changes
+        if image.size != self._preview_size:
+            self._preview_size = image.size
+            self.preview_canvas.configure(scrollregion=(0, 0) + image.size)
+    
+    def _preview_base(self) -> Optional[Image.Image]:
+        """Return the current image scaled for preview, without a watermark"""
+        if self.original_image is None:
+            return None
+        base = self._cache_get(self._base_cache, self._preview_path)
+        if base is None:
+            base = self.scale_for_preview(self.original_image)
+            self._cache_put(self._base_cache, self._preview_path, base)
+        self._preview_scale = base.width / self.original_image.width
+        return base
+    
+    def _preview_watermark(self, image_size, config: WatermarkConfig, scale: float, fast: bool):
+        """Return the watermark scaled to the preview and its position there, or None"""
+        watermark = self.image_processor.create_watermark(config)
+        if watermark is None:
+            return None
+        
+        # Position on the full-size image, as the export does, then scale both down
+        x, y = self.image_processor.calculate_position(image_size, watermark.size, config)
+        if scale != 1.0:
+            # While dragging, speed beats quality; BICUBIC matches LANCZOS at preview size
+            resample = Image.Resampling.NEAREST if fast else Image.Resampling.BICUBIC
+            watermark = watermark.resize((max(1, round(watermark.width * scale)),
+                                          max(1, round(watermark.height * scale))), resample)
+        return watermark, (round(x * scale), round(y * scale))
+    
+    def _schedule_preview(self):
+        """Coalesce bursts of control changes into a single preview render"""
+        if self._render_pending_id is None:
+            self._render_pending_id = self.root.after(40, self._do_preview)
+    
+    def _do_preview(self):
+        """Run the preview render scheduled by _schedule_preview"""
+        self._render_pending_id = None
+        self.sync_config_from_gui()
+        self.update_preview()
+    
+    def _load_base_image(self, file_path: str) -> Optional[Image.Image]:
+        """Load an image for preview, reusing the current original when it is the same file"""
+        if file_path == self._original_path and self.original_image is not None:
+            return self.original_image
+        # Drop the previous original first so two full-size images are never held at once
+        self.original_image = None
+        image = self.image_processor.load_image(file_path)
+        self._original_path = file_path if image is not None else None
+        return image
+    
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key):
+        """Look up a preview cache entry and mark it as recently used"""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+    
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key, value):
+        """Store a preview cache entry, evicting the least recently used"""
+        cache[key] = value
+        if len(cache) > PREVIEW_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def invalidate_preview_cache(self):
+        """Drop cached images and previews after the file list changes"""
+        self._original_path = None
+        self._base_cache.clear()
+        self._composite_cache.clear()
+    
+    def scale_for_preview(self, image: Image.Image, max_size: int = 800,
+                          resample: Image.Resampling = Image.Resampling.BICUBIC) -> Image.Image:
         """Scale image for preview display"""
         width, height = image.size
         
@@ -906,66 +1259,78 @@ class WatermarkApp:
         new_width = int(width * scale_factor)
         new_height = int(height * scale_factor)
         
-        return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # Box-reduce to within 3x of the target first so the filter only runs on a small image
+        return image.resize((new_width, new_height), resample, reducing_gap=3.0)
     
     def clear_preview(self):
         """Clear the preview area"""
         self.preview_canvas.delete("all")
+        self._preview_id = None
+        self._preview_size = None
         self.preview_photo = None
+        self._wm_photo = None
         self.original_image = None
         self.no_image_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
     
     # Watermark event handlers
     def on_watermark_type_change(self):
         """Handle watermark type change"""
-        watermark_type = self.var_watermark_type.get()
+        self.layout_watermark_type()
+        self._schedule_preview()
+    
+    def layout_watermark_type(self):
+        """Show the settings frames for the current watermark type, in tabs already built"""
+        is_text = self.var_watermark_type.get() == "text"
         
-        if watermark_type == "text":
-            self.text_frame.pack(fill=tk.X, padx=5, pady=5)
-            self.image_frame.pack_forget()
-            self.advanced_frame.pack(fill=tk.X, padx=5, pady=5)
-        else:
-            self.text_frame.pack_forget()
-            self.image_frame.pack(fill=tk.X, padx=5, pady=5)
-            self.advanced_frame.pack_forget()
+        if hasattr(self, 'text_frame'):
+            if is_text:
+                self.text_frame.pack(fill=tk.X, padx=5, pady=5)
+                self.image_frame.pack_forget()
+            else:
+                self.text_frame.pack_forget()
+                self.image_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        self.update_preview()
+        if hasattr(self, 'advanced_frame'):
+            if is_text:
+                self.advanced_frame.pack(fill=tk.X, padx=5, pady=5)
+            else:
+                self.advanced_frame.pack_forget()
     
     def on_text_change(self, event=None):
         """Handle text content change"""
-        self.update_preview()
+        self._schedule_preview()
     
     def on_font_change(self, event=None):
         """Handle font family change"""
-        self.update_preview()
+        self._schedule_preview()
     
     def on_font_size_change(self, event=None):
         """Handle font size change"""
-        self.update_preview()
+        self._schedule_preview()
     
     def on_font_style_change(self):
         """Handle font style change"""
-        self.update_preview()
+        self._schedule_preview()
     
     def on_scale_change(self, event=None):
         """Handle image watermark scale change"""
-        self.update_preview()
+        self._schedule_preview()
     
     def on_opacity_change(self, value=None):
         """Handle opacity change"""
-        self.update_preview()
+        self._schedule_preview()
     
     def on_rotation_change(self, value=None):
         """Handle rotation change"""
-        self.update_preview()
+        self._schedule_preview()
     
     def on_margin_change(self, event=None):
         """Handle margin change"""
-        self.update_preview()
+        self._schedule_preview()
     
     def on_stroke_change(self, event=None):
         """Handle stroke width change"""
-        self.update_preview()
+        self._schedule_preview()
     
     def on_format_change(self, event=None):
         """Handle output format change"""
@@ -977,7 +1342,7 @@ class WatermarkApp:
     
     def on_config_change(self, *args):
         """Handle any configuration change"""
-        self.update_preview()
+        self._schedule_preview()
     
     # Color choosers
     def choose_text_color(self):
@@ -987,7 +1352,7 @@ class WatermarkApp:
         if color[1]:  # color[1] is the hex value
             self.var_text_color.set(color[1])
             self.color_button.configure(bg=color[1])
-            self.update_preview()
+            self._schedule_preview()
     
     def choose_stroke_color(self):
         """Open color chooser for stroke color"""
@@ -996,19 +1361,22 @@ class WatermarkApp:
         if color[1]:
             self.var_stroke_color.set(color[1])
             self.stroke_color_button.configure(bg=color[1])
-            self.update_preview()
+            self._schedule_preview()
     
     def update_color_buttons(self):
         """Update color button appearances"""
-        self.color_button.configure(bg=self.var_text_color.get())
-        self.stroke_color_button.configure(bg=self.var_stroke_color.get())
+        # Buttons in tabs not built yet pick up the colours when they are created
+        if hasattr(self, 'color_button'):
+            self.color_button.configure(bg=self.var_text_color.get())
+        if hasattr(self, 'stroke_color_button'):
+            self.stroke_color_button.configure(bg=self.var_stroke_color.get())
     
     # Position methods
     def set_position(self, position):
         """Set watermark position"""
         self.var_position.set(position.value)
         self.current_config.position = position
-        self.update_preview()
+        self._schedule_preview()
     
     # Watermark image selection
     def select_watermark_image(self):
@@ -1031,18 +1399,26 @@ class WatermarkApp:
             if len(filename) > 30:
                 filename = filename[:27] + "..."
             self.watermark_image_label.config(text=filename, foreground='black')
-            self.update_preview()
+            self._schedule_preview()
     
     # Export methods
     def select_output_directory(self):
         """Select output directory for exports"""
         folder_path = self.file_manager.select_output_directory(self.root)
         if folder_path:
-            # Truncate long paths for display
-            display_path = folder_path
-            if len(display_path) > 40:
-                display_path = "..." + display_path[-37:]
-            self.output_dir_label.config(text=display_path, foreground='black')
+            self.update_output_dir_label()
+    
+    def update_output_dir_label(self):
+        """Show the output directory in the Export tab, once that tab exists"""
+        folder_path = self.file_manager.output_directory
+        if not folder_path or not hasattr(self, 'output_dir_label'):
+            return
+        
+        # Truncate long paths for display
+        display_path = folder_path
+        if len(display_path) > 40:
+            display_path = "..." + display_path[-37:]
+        self.output_dir_label.config(text=display_path, foreground='black')
     
     def export_current_image(self):
         """Export the currently selected image with watermark"""
@@ -1108,6 +1484,10 @@ class WatermarkApp:
             messagebox.showwarning("No Images", "Please import images to export.")
             return
         
+        if self._export_futures:
+            messagebox.showwarning("Export Running", "Please wait for the current export to finish.")
+            return
+        
         if not self.file_manager.output_directory:
             self.select_output_directory()
             if not self.file_manager.output_directory:
@@ -1145,26 +1525,96 @@ class WatermarkApp:
             # Update configuration
             self.update_config_from_gui()
             
-            # Process all images
-            results = self.image_processor.batch_process(
-                self.file_manager.imported_files,
-                self.current_config,
-                self.file_manager.output_directory,
-                self.var_output_format.get(),
-                self.var_jpeg_quality.get(),
+            # Hand each image to a worker process with its own copy of the settings
+            config = copy.copy(self.current_config)
+            output_dir = self.file_manager.output_directory
+            output_format = self.var_output_format.get()
+            quality = self.var_jpeg_quality.get()
+            output_name = self.file_manager.output_filename_generator(
                 self.var_filename_prefix.get(),
-                self.var_filename_suffix.get()
+                self.var_filename_suffix.get(),
+                output_format
             )
             
-            if results:
-                messagebox.showinfo("Export Successful", 
-                                  f"Successfully exported {len(results)} images to:\n"
-                                  f"{self.file_manager.output_directory}")
-            else:
-                messagebox.showerror("Export Failed", "Failed to export images.")
-                
+            if self._export_pool is None:
+                # Spawn rather than fork: forking while the render and thumbnail
+                # threads hold locks can deadlock the workers
+                self._export_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'))
+            self._export_futures = [
+                self._export_pool.submit(self.image_processor.process_file, file_path, config,
+                                         os.path.join(output_dir, output_name(file_path)),
+                                         output_format, quality)
+                for file_path in self.file_manager.imported_files
+            ]
+            self._export_output_dir = output_dir
+            
         except Exception as e:
             messagebox.showerror("Export Error", f"Error exporting images:\n{e}")
+            return
+        
+        self.show_export_progress(len(self._export_futures))
+        self.update_export_button()
+        self.root.after(100, self._poll_exports)
+    
+    def show_export_progress(self, total: int):
+        """Open a small window showing batch export progress"""
+        self._export_window = tk.Toplevel(self.root)
+        self._export_window.title("Exporting Images")
+        self._export_window.transient(self.root)
+        self._export_window.resizable(False, False)
+        # The window closes itself when the export finishes
+        self._export_window.protocol("WM_DELETE_WINDOW", lambda: None)
+        
+        self._export_label = ttk.Label(self._export_window, text=f"Exported 0 of {total}")
+        self._export_label.pack(padx=10, pady=(10, 5))
+        self._export_progress = ttk.Progressbar(self._export_window, length=300, maximum=total)
+        self._export_progress.pack(padx=10, pady=(0, 10))
+    
+    def update_export_button(self):
+        """Disable the batch export button while an export is running"""
+        if hasattr(self, 'export_all_button'):
+            self.export_all_button.configure(state=tk.DISABLED if self._export_futures else tk.NORMAL)
+    
+    def _poll_exports(self):
+        """Update export progress and report the results once every image is done"""
+        futures = self._export_futures
+        done = sum(future.done() for future in futures)
+        self._export_progress.configure(value=done)
+        self._export_label.configure(text=f"Exported {done} of {len(futures)}")
+        if done < len(futures):
+            self.root.after(100, self._poll_exports)
+            return
+        
+        self._export_futures = []
+        self._export_window.destroy()
+        self.update_export_button()
+        
+        results = []
+        pool_broken = False
+        for future in futures:
+            try:
+                output_path = future.result()
+            except BrokenProcessPool as e:
+                print(f"Error exporting image: {e}")
+                pool_broken = True
+                continue
+            except Exception as e:
+                print(f"Error exporting image: {e}")
+                continue
+            if output_path:
+                results.append(output_path)
+        
+        if pool_broken and self._export_pool is not None:
+            # A worker died; release the broken pool and start a fresh one for the next export
+            self._export_pool.shutdown(wait=False, cancel_futures=True)
+            self._export_pool = None
+        
+        if results:
+            messagebox.showinfo("Export Successful", 
+                              f"Successfully exported {len(results)} images to:\n"
+                              f"{self._export_output_dir}")
+        else:
+            messagebox.showerror("Export Failed", "Failed to export images.")
     
     # Template methods
     def save_template(self):
@@ -1200,6 +1650,7 @@ class WatermarkApp:
         if config:
             self.apply_config_to_gui(config)
             self.current_config = config
+            self.update_config_from_gui()
             self.update_preview()
             messagebox.showinfo("Template Loaded", f"Template '{template_name}' loaded successfully.")
         else:
@@ -1226,10 +1677,22 @@ class WatermarkApp:
     
     def refresh_template_list(self):
         """Refresh the template list"""
-        self.template_listbox.delete(0, tk.END)
+        # The Templates tab fills its list when it is built
+        if not hasattr(self, 'template_listbox'):
+            return
+        
         templates = self.template_manager.get_template_list()
-        for template in templates:
-            self.template_listbox.insert(tk.END, template)
+        
+        # Only delete and insert the rows that changed, back to front so indices stay valid
+        matcher = difflib.SequenceMatcher(None, self._template_names_shown, templates, autojunk=False)
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == 'equal':
+                continue
+            if i2 > i1:
+                self.template_listbox.delete(i1, i2 - 1)
+            if j2 > j1:
+                self.template_listbox.insert(i1, *templates[j1:j2])
+        self._template_names_shown = list(templates)
     
     # Canvas event handlers
     def on_thumbnail_frame_configure(self, event):
@@ -1246,6 +1709,9 @@ class WatermarkApp:
         except:
             pass  # Don't prevent closing if save fails
         
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
+        if self._export_pool is not None:
+            self._export_pool.shutdown(wait=False, cancel_futures=True)
         self.root.destroy()
     
     def run(self):
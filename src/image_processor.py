@@ -6,9 +6,17 @@ Handles text and image watermarking with various positioning and styling options
 from PIL import Image, ImageDraw, ImageFont, ImageEnhance
 import os
 import math
+from functools import lru_cache
 from typing import Tuple, Optional, List, Union
 from enum import Enum
 
+# Parsing a TrueType file is far slower than drawing with it, and previews
+# re-render the same font on every change
+@lru_cache(maxsize=64)
+def _load_truetype(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, reusing fonts already loaded at this size"""
+    return ImageFont.truetype(font_path, font_size)
+
 class WatermarkPosition(Enum):
     """Predefined watermark positions"""
     TOP_LEFT = "top_left"
@@ -58,6 +66,10 @@ class WatermarkConfig:
         # Margin settings
         self.margin_x = 20
         self.margin_y = 20
+    
+    def cache_key(self) -> tuple:
+        """Return a hashable snapshot of all settings for render caches"""
+        return tuple(self.__dict__.values())
 
 class ImageProcessor:
     """Main class for image processing and watermarking operations"""
@@ -92,7 +104,9 @@ class ImageProcessor:
     def load_image(self, file_path: str) -> Optional[Image.Image]:
         """Load an image from file path with EXIF orientation handling"""
         try:
-            if not self.is_supported_format(file_path):
+            # Files without an extension were accepted by content when imported,
+            # so leave those to Image.open to identify
+            if os.path.splitext(file_path)[1] and not self.is_supported_format(file_path):
                 return None
             
             image = Image.open(file_path)
@@ -225,7 +239,7 @@ class ImageProcessor:
         for font_path in font_paths_to_try:
             try:
                 if os.path.exists(font_path):
-                    return ImageFont.truetype(font_path, font_size)
+                    return _load_truetype(font_path, font_size)
             except Exception as e:
                 continue
         
@@ -311,7 +325,7 @@ class ImageProcessor:
         for font_path in chinese_fonts:
             try:
                 if os.path.exists(font_path):
-                    return ImageFont.truetype(font_path, font_size)
+                    return _load_truetype(font_path, font_size)
             except Exception:
                 continue
         
@@ -481,24 +495,28 @@ class ImageProcessor:
             print(f"Error creating image watermark: {e}")
             return None
     
-    def apply_watermark(self, image: Image.Image, config: WatermarkConfig) -> Image.Image:
-        """Apply watermark to an image based on configuration"""
-        # Create watermark based on type
+    def create_watermark(self, config: WatermarkConfig) -> Optional[Image.Image]:
+        """Create the watermark layer for the configured watermark type"""
         if config.watermark_type == WatermarkType.TEXT:
-            watermark = self.create_text_watermark(config.text, config)
-        else:
-            watermark = self.create_image_watermark(config)
-            
+            return self.create_text_watermark(config.text, config)
+        return self.create_image_watermark(config)
+    
+    def apply_watermark(self, image: Image.Image, config: WatermarkConfig,
+                        in_place: bool = False) -> Image.Image:
+        """Apply watermark to an image based on configuration, drawing into image itself if in_place"""
+        # Create watermark based on type
+        watermark = self.create_watermark(config)
+        
         if watermark is None:
             return image
         
         # Calculate position
         position = self.calculate_position(image.size, watermark.size, config)
         
-        # Create a copy of the original image
-        result = image.copy()
+        # Copy the original image unless the caller owns it
+        result = image if in_place else image.copy()
         
-        # Paste watermark onto the image
+        # Paste watermark onto the image; the mask blends only the watermark's own box
         result.paste(watermark, position, watermark)
         
         return result
@@ -547,6 +565,32 @@ class ImageProcessor:
         
         return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
     
+    def process_file(self, image_path: str, config: WatermarkConfig, output_path: str,
+                     output_format: str = 'JPEG', quality: int = 95,
+                     resize_options: Optional[dict] = None) -> Optional[str]:
+        """Watermark one image file and save it, returning the output path on success"""
+        try:
+            # Load image
+            image = self.load_image(image_path)
+            if image is None:
+                return None
+            
+            # Apply resize if specified
+            if resize_options:
+                image = self.resize_image(image, **resize_options)
+            
+            # Apply watermark; the freshly loaded image is not shared, so skip the copy
+            watermarked_image = self.apply_watermark(image, config, in_place=True)
+            
+            # Save image
+            if self.save_image(watermarked_image, output_path, output_format, quality):
+                return output_path
+            return None
+            
+        except Exception as e:
+            print(f"Error processing {image_path}: {e}")
+            return None
+    
     def batch_process(self, image_paths: List[str], config: WatermarkConfig, 
                      output_dir: str, output_format: str = 'JPEG', 
                      quality: int = 95, filename_prefix: str = "", 
@@ -555,37 +599,20 @@ class ImageProcessor:
         results = []
         
         for image_path in image_paths:
-            try:
-                # Load image
-                image = self.load_image(image_path)
-                if image is None:
-                    continue
-                
-                # Apply resize if specified
-                if resize_options:
-                    image = self.resize_image(image, **resize_options)
-                
-                # Apply watermark
-                watermarked_image = self.apply_watermark(image, config)
-                
-                # Generate output filename
-                base_name = os.path.splitext(os.path.basename(image_path))[0]
-                new_filename = f"{filename_prefix}{base_name}{filename_suffix}"
-                
-                # Add appropriate extension
-                if output_format.upper() == 'JPEG':
-                    new_filename += '.jpg'
-                else:
-                    new_filename += '.png'
-                
-                output_path = os.path.join(output_dir, new_filename)
-                
-                # Save image
-                if self.save_image(watermarked_image, output_path, output_format, quality):
-                    results.append(output_path)
-                
-            except Exception as e:
-                print(f"Error processing {image_path}: {e}")
-                continue
+            # Generate output filename
+            base_name = os.path.splitext(os.path.basename(image_path))[0]
+            new_filename = f"{filename_prefix}{base_name}{filename_suffix}"
+            
+            # Add appropriate extension
+            if output_format.upper() == 'JPEG':
+                new_filename += '.jpg'
+            else:
+                new_filename += '.png'
+            
+            output_path = os.path.join(output_dir, new_filename)
+            
+            if self.process_file(image_path, config, output_path, output_format,
+                                 quality, resize_options):
+                results.append(output_path)
         
         return results
\ No newline at end of file
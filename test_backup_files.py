@@ -0,0 +1,148 @@
+"""
+Test script for file backups
+Checks backup naming, copied contents and the fallback after a short kernel copy
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from file_manager import FileManager
+
+def create_test_files(root, names, size=200000):
+    """Create files with distinct contents, returns their paths"""
+    paths = []
+    for i, name in enumerate(names):
+        path = os.path.join(root, name)
+        with open(path, 'wb') as f:
+            f.write(bytes([i % 256]) * size + name.encode())
+        os.utime(path, (1000000 + i, 1000000 + i))
+        paths.append(path)
+    return paths
+
+def read(path):
+    """Return the contents of a file"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def test_backup_files():
+    """Test backing up several files at once"""
+    print("Testing batch backup...")
+
+    with tempfile.TemporaryDirectory() as root:
+        paths = create_test_files(root, ['a.jpg', 'b.png', 'c.jpg'])
+        fm = FileManager()
+
+        # An existing backup must not be overwritten
+        first = fm.backup_file(paths[0])
+        backups = fm.backup_files(paths + [paths[0]])
+        print(f"  Backups: {[os.path.basename(path) if path else None for path in backups]}")
+
+        expected = ['a_1.jpg', 'b.png', 'c.jpg', 'a_2.jpg']
+        if first is None or os.path.basename(first) != 'a.jpg':
+            print(f"  ✗ Single backup went to {first}")
+            return False
+        if [os.path.basename(path) if path else None for path in backups] != expected:
+            print(f"  ✗ Expected backup names {expected}")
+            return False
+
+        for source, backup in zip(paths + [paths[0]], backups):
+            if backup is None or read(source) != read(backup):
+                print(f"  ✗ Backup {backup} differs from {source}")
+                return False
+            if int(os.stat(backup).st_mtime) != int(os.stat(source).st_mtime):
+                print(f"  ✗ Backup {backup} did not keep the modification time")
+                return False
+
+    print("  ✓ Every file is copied to its own backup name")
+    return True
+
+def test_backup_to_unwritable_dir():
+    """Test that backups into an unusable directory return None"""
+    print("Testing backup to an unusable directory...")
+
+    with tempfile.TemporaryDirectory() as root:
+        paths = create_test_files(root, ['a.jpg'])
+        # A file where the backup directory should be
+        blocked = os.path.join(root, 'blocked')
+        with open(blocked, 'wb') as f:
+            f.write(b'not a directory')
+
+        backups = FileManager().backup_files(paths, backup_dir=blocked)
+        if backups != [None]:
+            print(f"  ✗ Expected no backup, got {backups}")
+            return False
+
+    print("  ✓ Failed backups are reported as None")
+    return True
+
+def test_short_kernel_copy():
+    """Test that a kernel copy stopping early falls back to a full copy"""
+    print("Testing truncated kernel copy...")
+
+    if not hasattr(os, 'copy_file_range'):
+        print("  os.copy_file_range is not available here; nothing to test")
+        return True
+
+    original = os.copy_file_range
+    calls = []
+    def short_copy_file_range(src, dst, count, *args, **kwargs):
+        # Copy part of the file, then report no progress as some filesystems do
+        calls.append(count)
+        if len(calls) > 1:
+            return 0
+        return original(src, dst, min(count, 4096), *args, **kwargs)
+
+    with tempfile.TemporaryDirectory() as root:
+        paths = create_test_files(root, ['a.jpg', 'b.jpg'])
+        os.copy_file_range = short_copy_file_range
+        try:
+            backups = FileManager().backup_files(paths[:1])
+        finally:
+            os.copy_file_range = original
+
+        if len(calls) < 2:
+            print("  ✗ Kernel copy was not attempted")
+            return False
+        if backups[0] is None or read(backups[0]) != read(paths[0]):
+            size = os.path.getsize(backups[0]) if backups[0] else 0
+            print(f"  ✗ Backup is {size} bytes, source is {os.path.getsize(paths[0])}")
+            return False
+
+    print("  ✓ Short kernel copy was completed by the fallback")
+    return True
+
+def main():
+    """Run all backup tests"""
+    print("=== Testing File Backups ===\n")
+
+    tests = [
+        ("Batch Backup", test_backup_files),
+        ("Unusable Backup Directory", test_backup_to_unwritable_dir),
+        ("Short Kernel Copy", test_short_kernel_copy)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        try:
+            if test_func():
+                passed += 1
+                print(f"✓ {test_name} PASSED")
+            else:
+                print(f"✗ {test_name} FAILED")
+        except Exception as e:
+            print(f"✗ {test_name} ERROR: {e}")
+
+    print(f"\n=== RESULTS ===")
+    print(f"Passed: {passed}/{total}")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
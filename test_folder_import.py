@@ -0,0 +1,223 @@
+"""
+Test script for folder and drag-drop import
+Checks the recursive directory walk, including folders that cannot be read,
+and dropped image files without an extension
+"""
+
+import sys
+import os
+import stat
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from file_manager import FileManager, DragDropHandler
+from image_processor import ImageProcessor, WatermarkConfig
+
+def create_test_tree(root):
+    """Create a folder tree with one unreadable subfolder, returns its path"""
+    files = ['0.png', 'notes.txt', 'a/1.jpg', 'a/nested/4.png', 'b/2.jpg', 'c/3.jpg']
+    for name in files:
+        path = os.path.join(root, *name.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(b'test')
+
+    locked_dir = os.path.join(root, 'b')
+    os.chmod(locked_dir, 0)
+    return locked_dir
+
+def is_unreadable(directory):
+    """Check whether listing a directory fails (it does not for root)"""
+    try:
+        os.listdir(directory)
+        return False
+    except OSError:
+        return True
+
+def import_names(root, recursive=True, ordered=False, **options):
+    """Import a folder and return the imported paths relative to root"""
+    file_manager = FileManager()
+    imported = file_manager.import_folder(root, recursive=recursive, **options)
+    if imported != file_manager.get_imported_files():
+        print("  ✗ Returned paths differ from the imported file list")
+    names = [os.path.relpath(path, root).replace(os.sep, '/') for path in imported]
+    return names if ordered else sorted(names)
+
+def expected_names(locked_dir):
+    """Images a recursive import of the test tree should find"""
+    expected = ['0.png', 'a/1.jpg', 'a/nested/4.png', 'c/3.jpg']
+    if is_unreadable(locked_dir):
+        print("  Folder b is unreadable; it should be skipped")
+        return expected
+    print("  Running with permission to read folder b; it should be imported")
+    return sorted(expected + ['b/2.jpg'])
+
+def test_folder_walk():
+    """Test recursive and non-recursive imports with an unreadable subfolder"""
+    print("Testing folder walk...")
+
+    with tempfile.TemporaryDirectory() as root:
+        locked_dir = create_test_tree(root)
+        try:
+            expected = expected_names(locked_dir)
+
+            recursive = import_names(root)
+            print(f"  Recursive import: {recursive}")
+            if recursive != expected:
+                print(f"  ✗ Expected {expected}")
+                return False
+
+            flat = import_names(root, recursive=False)
+            print(f"  Non-recursive import: {flat}")
+            if flat != ['0.png']:
+                print("  ✗ Expected only the top-level image")
+                return False
+        finally:
+            os.chmod(locked_dir, stat.S_IRWXU)
+
+    print("  ✓ Folder walk imports every readable image")
+    return True
+
+def test_parallel_walk():
+    """Test the parallel recursive walk against the serial one"""
+    print("Testing parallel folder walk...")
+
+    with tempfile.TemporaryDirectory() as root:
+        locked_dir = create_test_tree(root)
+        try:
+            expected = expected_names(locked_dir)
+
+            parallel = import_names(root, ordered=True, parallel=True)
+            print(f"  Parallel import: {parallel}")
+            if sorted(parallel) != expected:
+                print(f"  ✗ Expected {expected}")
+                return False
+            if parallel != import_names(root, ordered=True):
+                print("  ✗ Parallel walk imported in a different order than the serial walk")
+                return False
+        finally:
+            os.chmod(locked_dir, stat.S_IRWXU)
+
+    print("  ✓ Parallel walk matches the serial walk")
+    return True
+
+def test_inode_order_walk():
+    """Test the inode-ordered recursive walk"""
+    print("Testing inode-ordered folder walk...")
+
+    with tempfile.TemporaryDirectory() as root:
+        locked_dir = create_test_tree(root)
+        try:
+            expected = expected_names(locked_dir)
+
+            by_inode = import_names(root, ordered=True, inode_order=True)
+            print(f"  Inode-ordered import: {by_inode}")
+            if sorted(by_inode) != expected:
+                print(f"  ✗ Expected {expected}")
+                return False
+
+            # Top-level folders are visited by ascending inode number
+            folders = []
+            for name in by_inode:
+                folder = name.split('/')[0] if '/' in name else ''
+                if folder and folder not in folders:
+                    folders.append(folder)
+            inodes = [os.stat(os.path.join(root, folder)).st_ino for folder in folders]
+            print(f"  Folder order: {list(zip(folders, inodes))}")
+            if inodes != sorted(inodes):
+                print("  ✗ Folders were not visited in inode order")
+                return False
+        finally:
+            os.chmod(locked_dir, stat.S_IRWXU)
+
+    print("  ✓ Inode-ordered walk finds every readable image")
+    return True
+
+def test_reimport_skips_duplicates():
+    """Test that importing a folder twice adds nothing the second time"""
+    print("Testing repeated folder import...")
+
+    with tempfile.TemporaryDirectory() as root:
+        locked_dir = create_test_tree(root)
+        os.chmod(locked_dir, stat.S_IRWXU)
+
+        file_manager = FileManager()
+        first = file_manager.import_folder(root, recursive=True)
+        second = file_manager.import_folder(root, recursive=True)
+        if second or len(file_manager.get_imported_files()) != len(first):
+            print(f"  ✗ Second import added {second}")
+            return False
+
+    print("  ✓ Already imported files are skipped")
+    return True
+
+def test_extensionless_drop():
+    """Test that a dropped image without an extension is imported, previewed and exported"""
+    print("Testing dropped file without an extension...")
+
+    from PIL import Image
+
+    with tempfile.TemporaryDirectory() as root:
+        image_path = os.path.join(root, 'camera_dump')
+        Image.new('RGB', (300, 200), color='red').save(image_path, 'PNG')
+        text_path = os.path.join(root, 'README')
+        with open(text_path, 'w') as f:
+            f.write('not an image')
+
+        file_manager = FileManager()
+        handler = DragDropHandler.__new__(DragDropHandler)
+        handler.file_manager = file_manager
+        imported = []
+        handler.callback = imported.extend
+        handler._process_dropped_files([image_path, text_path])
+        if imported != [image_path] or file_manager.get_imported_files() != [image_path]:
+            print(f"  ✗ Expected only the image to be imported, got {imported}")
+            return False
+
+        processor = ImageProcessor()
+        if processor.load_image(image_path) is None:
+            print("  ✗ Imported image could not be loaded for preview")
+            return False
+        output_path = os.path.join(root, 'out', 'camera_dump.png')
+        if processor.process_file(image_path, WatermarkConfig(), output_path, 'PNG') != output_path:
+            print("  ✗ Imported image was not exported")
+            return False
+
+    print("  ✓ Image recognised by content is imported, loaded and exported")
+    return True
+
+def main():
+    """Run all folder import tests"""
+    print("=== Testing Folder Import ===\n")
+
+    tests = [
+        ("Folder Walk", test_folder_walk),
+        ("Parallel Walk", test_parallel_walk),
+        ("Inode Order Walk", test_inode_order_walk),
+        ("Extensionless Drop", test_extensionless_drop),
+        ("Repeated Import", test_reimport_skips_duplicates)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        try:
+            if test_func():
+                passed += 1
+                print(f"✓ {test_name} PASSED")
+            else:
+                print(f"✗ {test_name} FAILED")
+        except Exception as e:
+            print(f"✗ {test_name} ERROR: {e}")
+
+    print(f"\n=== RESULTS ===")
+    print(f"Passed: {passed}/{total}")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,127 @@
+"""
+Test script for in-place watermarking
+Checks that apply_watermark only draws into the caller's image when asked to
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from image_processor import ImageProcessor, WatermarkConfig, WatermarkPosition
+from PIL import Image
+
+def create_test_image():
+    """Create a plain test image"""
+    return Image.new('RGB', (400, 300), color='lightblue')
+
+def create_config():
+    """Text watermark in the center of the image"""
+    config = WatermarkConfig()
+    config.text = "In Place"
+    config.position = WatermarkPosition.CENTER
+    config.opacity = 100
+    return config
+
+def test_copy_by_default():
+    """Test that the default leaves the original image untouched"""
+    print("Testing default watermarking...")
+
+    processor = ImageProcessor()
+    image = create_test_image()
+    before = image.tobytes()
+
+    result = processor.apply_watermark(image, create_config())
+    if result is image:
+        print("  ✗ Default returned the original image")
+        return False
+    if image.tobytes() != before:
+        print("  ✗ Original image was modified")
+        return False
+    if result.tobytes() == before:
+        print("  ✗ No watermark was drawn")
+        return False
+
+    print("  ✓ Watermark drawn on a copy")
+    return True
+
+def test_in_place():
+    """Test that in_place draws into the given image"""
+    print("Testing in-place watermarking...")
+
+    processor = ImageProcessor()
+    config = create_config()
+    copied = processor.apply_watermark(create_test_image(), config)
+
+    image = create_test_image()
+    result = processor.apply_watermark(image, config, in_place=True)
+    if result is not image:
+        print("  ✗ In-place watermarking returned a different image")
+        return False
+    if image.tobytes() != copied.tobytes():
+        print("  ✗ In-place result differs from the copied result")
+        return False
+
+    print("  ✓ Watermark drawn into the original image")
+    return True
+
+def test_process_file():
+    """Test that exported files carry the watermark"""
+    print("Testing file export...")
+
+    processor = ImageProcessor()
+    config = create_config()
+    with tempfile.TemporaryDirectory() as root:
+        source = os.path.join(root, 'photo.png')
+        create_test_image().save(source)
+        output = os.path.join(root, 'out', 'photo.png')
+
+        if processor.process_file(source, config, output, output_format='PNG') != output:
+            print("  ✗ Export failed")
+            return False
+
+        expected = processor.apply_watermark(create_test_image(), config)
+        with Image.open(output) as exported, Image.open(source) as original:
+            if exported.convert('RGB').tobytes() != expected.convert('RGB').tobytes():
+                print("  ✗ Exported image does not match the watermarked image")
+                return False
+            if original.tobytes() != create_test_image().tobytes():
+                print("  ✗ Source file was modified")
+                return False
+
+    print("  ✓ Exported image is watermarked and the source is untouched")
+    return True
+
+def main():
+    """Run all in-place watermark tests"""
+    print("=== Testing In-Place Watermarking ===\n")
+
+    tests = [
+        ("Copy By Default", test_copy_by_default),
+        ("In Place", test_in_place),
+        ("Process File", test_process_file)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        try:
+            if test_func():
+                passed += 1
+                print(f"✓ {test_name} PASSED")
+            else:
+                print(f"✗ {test_name} FAILED")
+        except Exception as e:
+            print(f"✗ {test_name} ERROR: {e}")
+
+    print(f"\n=== RESULTS ===")
+    print(f"Passed: {passed}/{total}")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,194 @@
+"""
+Test script for the release source archive cache
+Checks cache hits, reuse of unchanged files and pruning of old archives
+"""
+
+import sys
+import os
+import tempfile
+import zipfile
+
+# Release helpers live next to this script
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import release_utils
+from release_utils import arcname_for, cached_source_zip, collect
+
+SOURCE_FILES = {
+    'main.py': b'print("main")\n',
+    'src/a.py': b'A = 1\n' * 200,
+    'src/b.py': b'B = 2\n' * 200,
+    'src/logo.png': b'\x89PNG' + bytes(range(256)) * 4,
+}
+
+def write_sources(files):
+    """Write files into the current directory"""
+    for name, content in files.items():
+        os.makedirs(os.path.dirname(name) or '.', exist_ok=True)
+        with open(name, 'wb') as f:
+            f.write(content)
+
+def build():
+    """Build the source archive for the current directory"""
+    entries = [(path, arcname_for(path), st) for path, st in collect(['main.py', 'src/'])]
+    return cached_source_zip(entries)
+
+def archive_matches(zip_path, files):
+    """Check that an archive holds exactly the given files"""
+    with zipfile.ZipFile(zip_path) as zf:
+        if zf.testzip() is not None:
+            return False
+        contents = {info.filename: zf.read(info) for info in zf.infolist()}
+    return contents == files
+
+def cached_archives():
+    """Return the archives currently in the cache directory"""
+    return sorted(name for name in os.listdir(release_utils.CACHE_DIR) if name.endswith('.zip'))
+
+def in_temp_tree(test_func):
+    """Run a test inside a fresh temporary source tree"""
+    def wrapper():
+        previous = os.getcwd()
+        with tempfile.TemporaryDirectory() as root:
+            os.chdir(root)
+            try:
+                write_sources(SOURCE_FILES)
+                return test_func()
+            finally:
+                os.chdir(previous)
+    return wrapper
+
+@in_temp_tree
+def test_cache_hit():
+    """Test that unchanged inputs return the cached archive"""
+    print("Testing cache hit...")
+
+    first = build()
+    print(f"  Built {first}")
+    if not archive_matches(first, SOURCE_FILES):
+        print("  ✗ Archive contents differ from the sources")
+        return False
+
+    # Age the archive so the hit's timestamp update is visible
+    os.utime(first, (0, 0))
+    second = build()
+    if second != first or cached_archives() != [os.path.basename(first)]:
+        print(f"  ✗ Expected the cached archive, got {second}")
+        return False
+    if os.stat(first).st_mtime == 0:
+        print("  ✗ Cache hit was not marked as recently used")
+        return False
+
+    print("  ✓ Unchanged inputs are not recompressed")
+    return True
+
+@in_temp_tree
+def test_reuse_unchanged_files():
+    """Test rebuilding after an edit reuses the unchanged entries"""
+    print("Testing rebuild after an edit...")
+
+    first = build()
+    with zipfile.ZipFile(first) as zf:
+        before = {info.filename: info.CRC for info in zf.infolist()}
+
+    changed = dict(SOURCE_FILES)
+    changed['src/a.py'] = b'A = 3\n' * 300
+    write_sources({'src/a.py': changed['src/a.py']})
+
+    reused = []
+    original_read_raw = release_utils._read_raw
+    def tracking_read_raw(fp, zinfo):
+        reused.append(zinfo.filename)
+        return original_read_raw(fp, zinfo)
+
+    release_utils._read_raw = tracking_read_raw
+    try:
+        second = build()
+    finally:
+        release_utils._read_raw = original_read_raw
+
+    print(f"  Reused entries: {sorted(reused)}")
+    if second == first or not archive_matches(second, changed):
+        print("  ✗ Rebuilt archive does not match the edited sources")
+        return False
+    if sorted(reused) != sorted(name for name in before if name != 'src/a.py'):
+        print("  ✗ Expected every unchanged file to be reused")
+        return False
+
+    print("  ✓ Only the edited file was recompressed")
+    return True
+
+@in_temp_tree
+def test_prune_old_archives():
+    """Test that the cache keeps only the newest archives"""
+    print("Testing cache pruning...")
+
+    keep = release_utils.CACHE_KEEP
+    for i in range(keep + 2):
+        # Sizes differ so every build has a new cache key
+        write_sources({'main.py': f'print({"x" * i!r})\n'.encode()})
+        build()
+
+    # Leftover from an interrupted build
+    with open(os.path.join(release_utils.CACHE_DIR, 'stale.zip.partial'), 'wb') as f:
+        f.write(b'partial')
+    write_sources({'main.py': b'print("last")\n'})
+    latest = build()
+
+    remaining = cached_archives()
+    print(f"  Cached archives: {remaining}")
+    if len(remaining) != keep or os.path.basename(latest) not in remaining:
+        print(f"  ✗ Expected the {keep} newest archives")
+        return False
+    if os.path.exists(os.path.join(release_utils.CACHE_DIR, 'stale.zip.partial')):
+        print("  ✗ Partial archive was not removed")
+        return False
+
+    # Records for pruned archives are dropped, the rest still resolve
+    release_cache = release_utils._ReleaseCache().load()
+    try:
+        kept = {os.path.abspath(path) for path in (os.path.join(release_utils.CACHE_DIR, name) for name in remaining)}
+        if any(record[3] not in kept for record in release_cache.files.values()):
+            print("  ✗ Release cache still points at pruned archives")
+            return False
+        for path, st in collect(['main.py', 'src/']):
+            if release_cache.lookup(path, st) is None:
+                print(f"  ✗ No reusable copy recorded for {path}")
+                return False
+    finally:
+        release_cache.close()
+
+    print("  ✓ Old archives and their records are pruned")
+    return True
+
+def main():
+    """Run all release archive cache tests"""
+    print("=== Testing Release Archive Cache ===\n")
+
+    tests = [
+        ("Cache Hit", test_cache_hit),
+        ("Reuse Unchanged Files", test_reuse_unchanged_files),
+        ("Prune Old Archives", test_prune_old_archives)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        try:
+            if test_func():
+                passed += 1
+                print(f"✓ {test_name} PASSED")
+            else:
+                print(f"✗ {test_name} FAILED")
+        except Exception as e:
+            print(f"✗ {test_name} ERROR: {e}")
+
+    print(f"\n=== RESULTS ===")
+    print(f"Passed: {passed}/{total}")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
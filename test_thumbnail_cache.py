@@ -0,0 +1,204 @@
+"""
+Test script for the on-disk thumbnail cache
+Checks cache hits and misses, header reuse, failed cache writes and pruning
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import file_manager
+from file_manager import FileManager
+from PIL import Image
+
+def create_test_image(path, size=(400, 300), color='lightblue'):
+    """Create a simple test image"""
+    Image.new('RGB', size, color=color).save(path)
+
+def count_renders():
+    """Count thumbnails rendered from source images, returns the counter list"""
+    renders = []
+    original = FileManager._render_thumbnail
+    def counting_render(self, image_path, thumbnail_size):
+        renders.append(image_path)
+        return original(self, image_path, thumbnail_size)
+    FileManager._render_thumbnail = counting_render
+    return renders, original
+
+def with_cache_dir(test_func):
+    """Run a test with the thumbnail cache in a temporary directory's thumbs folder"""
+    def wrapper():
+        original_dir = file_manager._THUMB_CACHE_DIR
+        with tempfile.TemporaryDirectory() as root:
+            file_manager._THUMB_CACHE_DIR = os.path.join(root, 'thumbs')
+            try:
+                return test_func()
+            finally:
+                file_manager._THUMB_CACHE_DIR = original_dir
+    return wrapper
+
+@with_cache_dir
+def test_cache_hit_and_miss():
+    """Test that thumbnails are reused until the source image changes"""
+    root = os.path.dirname(file_manager._THUMB_CACHE_DIR)
+    print("Testing thumbnail cache hits...")
+
+    image_path = os.path.join(root, 'photo.png')
+    create_test_image(image_path)
+    fm = FileManager()
+
+    renders, original = count_renders()
+    try:
+        first = fm.create_thumbnail(image_path)
+        second = fm.create_thumbnail(image_path)
+        if first is None or second is None or len(renders) != 1:
+            print(f"  ✗ Expected one render for two requests, got {len(renders)}")
+            return False
+        if second.size != first.size or max(second.size) > 150:
+            print(f"  ✗ Cached thumbnail has size {second.size}, expected {first.size}")
+            return False
+        print(f"  Cached thumbnails: {os.listdir(file_manager._THUMB_CACHE_DIR)}")
+
+        # A different size is a different cache entry
+        fm.create_thumbnail(image_path, (64, 64))
+        if len(renders) != 2:
+            print("  ✗ Thumbnail size is not part of the cache key")
+            return False
+
+        # Replacing the image must not return the old thumbnail
+        create_test_image(image_path, size=(300, 400), color='red')
+        replaced = fm.create_thumbnail(image_path)
+        if len(renders) != 3 or replaced is None or replaced.size == first.size:
+            print("  ✗ Edited image was served from the cache")
+            return False
+    finally:
+        FileManager._render_thumbnail = original
+
+    print("  ✓ Thumbnails are cached per image version and size")
+    return True
+
+@with_cache_dir
+def test_header_from_cache_hit():
+    """Test that a cache hit records the source header for get_image_info"""
+    root = os.path.dirname(file_manager._THUMB_CACHE_DIR)
+    print("Testing image info after a cache hit...")
+
+    image_path = os.path.join(root, 'photo.png')
+    create_test_image(image_path, size=(640, 480))
+    FileManager().create_thumbnail(image_path)
+
+    # A new session finds the thumbnail on disk and must not reopen the source
+    fm = FileManager()
+    if fm.create_thumbnail(image_path) is None:
+        print("  ✗ No thumbnail returned from the cache")
+        return False
+
+    opened = []
+    original_open = Image.open
+    def tracking_open(fp, *args, **kwargs):
+        opened.append(fp)
+        return original_open(fp, *args, **kwargs)
+    Image.open = tracking_open
+    try:
+        info = fm.get_image_info(image_path)
+    finally:
+        Image.open = original_open
+
+    print(f"  Image info: {info}")
+    if opened:
+        print(f"  ✗ get_image_info reopened {opened}")
+        return False
+    if not info or info['size'] != (640, 480) or info['mode'] != 'RGB' or info['format'] != 'PNG':
+        print("  ✗ Header information is wrong")
+        return False
+
+    print("  ✓ Header information comes with the cached thumbnail")
+    return True
+
+@with_cache_dir
+def test_failed_cache_write():
+    """Test that a thumbnail is still returned when it cannot be cached"""
+    root = os.path.dirname(file_manager._THUMB_CACHE_DIR)
+    print("Testing unwritable thumbnail cache...")
+
+    image_path = os.path.join(root, 'photo.jpg')
+    create_test_image(image_path)
+    # A file where the cache directory should be makes every write fail
+    with open(file_manager._THUMB_CACHE_DIR, 'wb') as f:
+        f.write(b'not a directory')
+
+    thumbnail = FileManager().create_thumbnail(image_path)
+    if thumbnail is None:
+        print("  ✗ No thumbnail returned")
+        return False
+    if [name for name in os.listdir(root) if name.endswith('.tmp')]:
+        print("  ✗ Temporary file left behind")
+        return False
+
+    print("  ✓ Thumbnail returned without caching it")
+    return True
+
+@with_cache_dir
+def test_prune_cache():
+    """Test that pruning deletes the least recently used thumbnails"""
+    root = os.path.dirname(file_manager._THUMB_CACHE_DIR)
+    print("Testing thumbnail cache pruning...")
+
+    cache_dir = file_manager._THUMB_CACHE_DIR
+    os.makedirs(cache_dir)
+    for i in range(10):
+        path = os.path.join(cache_dir, f'{i}.jpg')
+        with open(path, 'wb') as f:
+            f.write(b'x' * 1000)
+        os.utime(path, (1000 + i, 1000 + i))
+
+    file_manager._prune_thumb_cache(max_bytes=20000)
+    if len(os.listdir(cache_dir)) != 10:
+        print("  ✗ Cache below the limit was pruned")
+        return False
+
+    file_manager._prune_thumb_cache(max_bytes=8000)
+    remaining = sorted(os.listdir(cache_dir))
+    print(f"  Remaining after pruning: {remaining}")
+    if remaining != [f'{i}.jpg' for i in range(4, 10)]:
+        print("  ✗ Expected the 6 most recently used thumbnails to remain")
+        return False
+
+    print("  ✓ Oldest thumbnails are pruned down to 3/4 of the limit")
+    return True
+
+def main():
+    """Run all thumbnail cache tests"""
+    print("=== Testing Thumbnail Cache ===\n")
+
+    tests = [
+        ("Cache Hit And Miss", test_cache_hit_and_miss),
+        ("Header From Cache Hit", test_header_from_cache_hit),
+        ("Failed Cache Write", test_failed_cache_write),
+        ("Prune Cache", test_prune_cache)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n--- {test_name} ---")
+        try:
+            if test_func():
+                passed += 1
+                print(f"✓ {test_name} PASSED")
+            else:
+                print(f"✗ {test_name} FAILED")
+        except Exception as e:
+            print(f"✗ {test_name} ERROR: {e}")
+
+    print(f"\n=== RESULTS ===")
+    print(f"Passed: {passed}/{total}")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)